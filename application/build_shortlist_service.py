@@ -7,6 +7,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 import time
 
+import numpy as np
 import pandas as pd
 
 from application.ports import (
@@ -19,28 +20,35 @@ from application.ports import (
 )
 
 
-def _target_currency(house_ticker: str) -> str:
-    if house_ticker.endswith(".US"):
-        return "USD"
-    if house_ticker.endswith(".HK"):
-        return "HKD"
-    if house_ticker.endswith(".JP"):
-        return "JPY"
-    return "USD"
+# fundamentals row layout (FundamentalsRepository dict contract), in output column order
+_FIELDS = (
+    "ticker", "y_symbol", "fs_date", "currency", "assets_current", "liab_total", "ncav",
+    "shares_out", "ncav_ps", "data_age_days", "fs_source", "fs_selected_col", "note",
+)
+# fundamentals fields coerced to float64 once, so later math skips per-step coercion
+_NUMERIC_COLS = ("assets_current", "liab_total", "ncav", "shares_out", "ncav_ps", "data_age_days")
+# low-cardinality labels stored as category
+_CATEGORY_COLS = ("currency", "target_ccy", "fs_source")
+
+# house-ticker suffix -> trading currency; anything else defaults to USD
+_TARGET_CCY_BY_SUFFIX: Dict[str, str] = {".US": "USD", ".HK": "HKD", ".JP": "JPY"}
+
+
+def _as_row(rec: dict) -> tuple:
+    return tuple(rec.get(k) for k in _FIELDS)
+
 
+def _empty_row(house_ticker: str, note: str) -> tuple:
+    return _as_row({"ticker": house_ticker, "currency": "", "note": note})
 
-def _convert_ncavps(fin_ccy: str, target_ccy: str, ncav_ps: Optional[float], usd_per: Dict[str, float]) -> Optional[float]:
-    if ncav_ps is None:
-        return None
-    fin = (fin_ccy or "USD").upper()
-    tgt = (target_ccy or "USD").upper()
-    if fin == tgt:
-        return float(ncav_ps)
-    uf = usd_per.get(fin)
-    ut = usd_per.get(tgt)
-    if uf is None or ut is None or uf == 0:
-        return None
-    return float(ncav_ps) * (uf / ut)
+
+def _target_currency(tickers: pd.Series) -> np.ndarray:
+    t = tickers.astype(str)
+    return np.select(
+        [t.str.endswith(sfx).to_numpy(dtype=bool) for sfx in _TARGET_CCY_BY_SUFFIX],
+        list(_TARGET_CCY_BY_SUFFIX.values()),
+        default="USD",
+    )
 
 
 class BuildShortlistService:
@@ -64,7 +72,6 @@ class BuildShortlistService:
 
     def run(self, cfg: ShortlistConfig) -> dict:
         t0 = time.time()
-        rows: List[dict] = []
 
         # 1) Load universe
         urows = self.universe_repo.load_tickers()
@@ -81,111 +88,96 @@ class BuildShortlistService:
             max(1, int(cfg.max_workers or 1)),
         )
 
-        def _one(h: str) -> dict:
+        def _one(h: str) -> tuple:
             if cfg.prices_only:
                 rec = self.fundamentals_repo.get_cached(h)
                 if rec is None:
-                    return {
-                        "ticker": h,
-                        "y_symbol": None,
-                        "fs_date": None,
-                        "currency": "",
-                        "assets_current": None,
-                        "liab_total": None,
-                        "ncav": None,
-                        "shares_out": None,
-                        "ncav_ps": None,
-                        "data_age_days": None,
-                        "fs_source": None,
-                        "fs_selected_col": None,
-                        "note": "no cache",
-                    }
-                return rec
+                    return _empty_row(h, "no cache")
+                return _as_row(rec)
             else:
-                return self.fundamentals_repo.get_or_update(h, cfg.fetch_timeout)
+                # the repository serves records fetched within cache_ttl_hours without a request
+                return _as_row(self.fundamentals_repo.get_or_update(h, cfg.fetch_timeout, cfg.cache_ttl_hours))
+
+        # Collect results in original order for deterministic output
+        results: List[Optional[tuple]] = [None] * len(tickers)
 
         done = 0
         total = len(tickers)
         workers = max(1, int(cfg.max_workers or 1))
-        # Collect results in original order for deterministic output
-        order_map: Dict[str, int] = {t: i for i, t in enumerate(tickers)}
-        results: List[Tuple[int, dict]] = []
 
         if total > 0:
             with ThreadPoolExecutor(max_workers=workers) as ex:
-                futs = {ex.submit(_one, h): h for h in tickers}
+                futs = {ex.submit(_one, h): i for i, h in enumerate(tickers)}
                 for f in as_completed(futs):
-                    h = futs[f]
+                    i = futs[f]
+                    h = tickers[i]
                     try:
-                        rec = f.result()
+                        row = f.result()
                     except Exception as e:
-                        rec = {
-                            "ticker": h,
-                            "y_symbol": None,
-                            "fs_date": None,
-                            "currency": "",
-                            "assets_current": None,
-                            "liab_total": None,
-                            "ncav": None,
-                            "shares_out": None,
-                            "ncav_ps": None,
-                            "data_age_days": None,
-                            "fs_source": None,
-                            "fs_selected_col": None,
-                            "note": f"error: {e}",
-                        }
-                    results.append((order_map[h], rec))
+                        row = _empty_row(h, f"error: {e}")
+                    results[i] = row
                     done += 1
                     if (done % self.log_every) == 0 or done == total:
                         self.log.info("Fundamentals progress: %d / %d (%.1f%%)", done, total, 100.0 * done / max(1, total))
 
-        results.sort(key=lambda x: x[0])
-        rows = [rec for _, rec in results]
-        base = pd.DataFrame(rows)
+        base = pd.DataFrame.from_records(results, columns=_FIELDS)
+        for c in _NUMERIC_COLS:
+            base[c] = pd.to_numeric(base[c], errors="coerce").astype("float64")
         self.log.info("Fundamentals collected: %d rows", len(base))
 
         # 3) FX normalization (FS -> trading ccy)
-        base["target_ccy"] = base["ticker"].map(_target_currency)
-        base["currency"] = base.get("currency", pd.Series([None] * len(base)))
+        base["target_ccy"] = _target_currency(base["ticker"])
         base["currency"] = base["currency"].astype(object)
         na_mask = base["currency"].isna()
         base.loc[na_mask, "currency"] = base.loc[na_mask, "target_ccy"]
         empty_mask = base["currency"].astype(str).str.strip() == ""
         base.loc[empty_mask, "currency"] = base.loc[empty_mask, "target_ccy"]
 
-        need_ccy = sorted(
-            set(
-                base["currency"].dropna().astype(str).str.upper().tolist()
-                + base["target_ccy"].dropna().astype(str).str.upper().tolist()
-            )
-        )
+        fin = base["currency"].fillna("USD").astype(str).str.upper()
+        tgt = base["target_ccy"].fillna("USD").astype(str).str.upper()
+
+        # rates for every row, not just NCAV-positive ones: ncav_all.csv carries ncav_ps_target for all
+        all_ccy = pd.concat([base["currency"].dropna(), base["target_ccy"].dropna()], ignore_index=True)
+        need_ccy = np.sort(pd.unique(all_ccy.astype(str).str.upper().to_numpy())).tolist()
         self.log.info("Fetching FX rates for %d currencies...", len(need_ccy))
         usd_per = self.fx_provider.usd_per_ccy(need_ccy)
         self.log.debug("FX map (USD per CCY): %s", usd_per)
 
-        base["ncav_ps_target"] = base.apply(
-            lambda r: _convert_ncavps(r["currency"], r["target_ccy"], r["ncav_ps"], usd_per), axis=1
-        )
+        # vectorized FS -> target conversion; unknown/zero rates propagate as NaN
+        uf = fin.map(usd_per).astype("float64").to_numpy()
+        ut = tgt.map(usd_per).astype("float64").to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cross = np.where((uf == 0) | (ut == 0), np.nan, uf / ut)
+        ratio = np.where(fin.to_numpy() == tgt.to_numpy(), 1.0, cross)
+        base["ncav_ps_target"] = base["ncav_ps"] * ratio
+        for c in _CATEGORY_COLS:
+            if c in base.columns:
+                base[c] = base[c].astype("category")
 
         # 4) Gate: FS recency + NCAV positive
-        base["within_2y"] = base["fs_date"].apply(
-            lambda d: (pd.notna(d) and (pd.Timestamp.now() - pd.to_datetime(d)).days <= cfg.max_fs_age_days)
-        )
-        base["ncav_positive"] = base["ncav"].apply(lambda x: (x is not None) and (pd.notna(x)) and (float(x) > 0))
-        base["ncavps_pos_target"] = base["ncav_ps_target"].apply(
-            lambda x: (x is not None) and (pd.notna(x)) and (float(x) > 0)
-        )
+        fs = pd.to_datetime(base["fs_date"], errors="coerce", utc=True)
+        now = pd.Timestamp.now(tz="UTC")
+        # keep plain bool arrays around so counts/filters below don't re-scan the frame
+        within_2y = (fs.notna() & ((now - fs).dt.days <= cfg.max_fs_age_days)).to_numpy(dtype=bool)
+        ncav_positive = base["ncav"].gt(0).to_numpy(dtype=bool)
+        ncavps_pos_target = base["ncav_ps_target"].gt(0).to_numpy(dtype=bool)
+        base["within_2y"] = within_2y
+        base["ncav_positive"] = ncav_positive
+        base["ncavps_pos_target"] = ncavps_pos_target
+        n_within_2y = int(within_2y.sum())
+        n_ncav_positive = int(ncav_positive.sum())
 
         self.log.info(
             "Gate counts → within_2y: %d, ncav_positive: %d, ncavps_pos_target: %d",
-            int(base["within_2y"].sum()),
-            int(base["ncav_positive"].sum()),
-            int(base["ncavps_pos_target"].sum()),
+            n_within_2y,
+            n_ncav_positive,
+            int(ncavps_pos_target.sum()),
         )
 
         # 5) Prices only for viable
-        need_price_mask = base["within_2y"] & base["ncav_positive"] & base["ncavps_pos_target"]
-        price_symbols = sorted(set(base.loc[need_price_mask, "y_symbol"].dropna().astype(str)))
+        need_price_mask = within_2y & ncav_positive & ncavps_pos_target
+        eligible_syms = base.loc[need_price_mask, "y_symbol"].dropna().astype(str).to_numpy()
+        price_symbols = np.sort(pd.unique(eligible_syms)).tolist()
         self.log.info("Fetching prices for %d Yahoo symbols (batch=%d)...", len(price_symbols), cfg.prices_batch)
 
         # chunked logging around price client
@@ -193,44 +185,44 @@ class BuildShortlistService:
             for i in range(0, len(seq), n):
                 yield i // n + 1, seq[i : i + n]
 
-        px_map: Dict[str, Tuple[Optional[float], Optional[str]]] = {}
-        for b_idx, chunk in _chunks(price_symbols, cfg.prices_batch):
+        def _fetch_batch(item):
+            b_idx, chunk = item
             self.log.info("Price batch %d: %d symbols", b_idx, len(chunk))
-            res = self.price_client.latest_closes(chunk, batch_size=cfg.prices_batch)
-            px_map.update(res)
+            return self.price_client.latest_closes(chunk, batch_size=cfg.prices_batch)
 
-        base["price"] = base["y_symbol"].map(lambda y: px_map.get(y, (None, None))[0])
-        base["price_date"] = base["y_symbol"].map(lambda y: px_map.get(y, (None, None))[1])
+        # overlap batch round-trips; ex.map keeps batch order so later batches still win on merge
+        px_map: Dict[str, Tuple[Optional[float], Optional[str]]] = {}
+        batches = list(_chunks(price_symbols, cfg.prices_batch))
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as ex:
+                for res in ex.map(_fetch_batch, batches):
+                    px_map.update(res)
 
-        # 6) Ratio + pass flag
-        def _ratio(price, ncavps_tgt):
-            try:
-                price = float(price)
-                ncavps_tgt = float(ncavps_tgt)
-                if ncavps_tgt == 0:
-                    return None
-                return price / ncavps_tgt
-            except Exception:
-                return None
-
-        base["price_vs_ncavps"] = base.apply(lambda r: _ratio(r["price"], r["ncav_ps_target"]), axis=1)
-        base["is_ncav_netnet"] = base.apply(
-            lambda r: (
-                r["within_2y"]
-                and r["ncav_positive"]
-                and r["ncavps_pos_target"]
-                and (r["price_vs_ncavps"] is not None)
-                and (r["price_vs_ncavps"] < 1.0)
-            ),
-            axis=1,
-        )
+        price_by_sym = {k: v[0] for k, v in px_map.items()}
+        date_by_sym = {k: v[1] for k, v in px_map.items()}
+        base["price"] = base["y_symbol"].map(price_by_sym)
+        base["price_date"] = base["y_symbol"].map(date_by_sym)
 
-        shortlist_count = int((base["is_ncav_netnet"] == True).sum())
+        # 6) Ratio + pass flag
+        px = pd.to_numeric(base["price"], errors="coerce").to_numpy(dtype="float64")
+        nps = base["ncav_ps_target"].to_numpy(dtype="float64")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_vs_ncavps = np.where(nps == 0, np.nan, px / nps)
+        base["price_vs_ncavps"] = price_vs_ncavps
+        # NaN ratios compare False, so no separate notna() pass is needed
+        netnet_mask = need_price_mask & (price_vs_ncavps < 1.0)
+        base["is_ncav_netnet"] = netnet_mask
+
+        shortlist_count = int(netnet_mask.sum())
         self.log.info("Shortlist count: %d", shortlist_count)
 
         # 7) Save & meta
-        out_all = self.out_repo.save_all(base)
-        shortlist_df = base[base["is_ncav_netnet"] == True].copy().reset_index(drop=True)
+        if cfg.output_format == "parquet":
+            out_all = self.out_repo.save_all_parquet(base)
+        else:
+            out_all = self.out_repo.save_all(base)
+        # writers emit index=False, so the masked slice goes straight through (no reset/copy)
+        shortlist_df = base.loc[netnet_mask]
         out_short = self.out_repo.save_shortlist(shortlist_df)
 
         meta = {
@@ -240,13 +232,15 @@ class BuildShortlistService:
                 "universe": int(len(tickers)),
                 "eligible_for_price": int(len(price_symbols)),
                 "with_ncavps_target": int(base["ncav_ps_target"].notna().sum()),
-                "within_2y": int(base["within_2y"].sum()),
-                "ncav_positive": int(base["ncav_positive"].sum()),
+                "within_2y": n_within_2y,
+                "ncav_positive": n_ncav_positive,
                 "shortlist": shortlist_count,
             },
             "fx": {"usd_per": usd_per},
             "outputs": {
-                "ncav_all_csv": str(out_all),
+                "ncav_all_path": str(out_all),
+                "ncav_all_format": cfg.output_format,
+                "ncav_all_csv": str(out_all),  # kept for existing readers; see ncav_all_format
                 "ncav_shortlist_csv": str(out_short),
             },
             "elapsed_sec": round(time.time() - t0, 2),
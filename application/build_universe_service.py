@@ -2,10 +2,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Dict, Any
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+import re
 import pandas as pd
 
 from application.ports import TickerSource, UniverseRepository, UniverseBuilder
 
+_TICKER_BASE_RE = re.compile(r"([A-Za-z0-9]{1,10})")
+
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     want = ["ticker_base","ticker","name","country","mic"]
     if df is None or df.empty:
@@ -14,9 +18,8 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
     # lightweight coercions
     if "ticker_base" in out.columns:
-        out["ticker_base"] = (
-            out["ticker_base"].astype(str).str.extract(r"([A-Za-z0-9]{1,10})")[0]
-        )
+        # "string" keeps missing codes as <NA> (dropped below) instead of the literal "nan"/"None"
+        out["ticker_base"] = out["ticker_base"].astype("string").str.extract(_TICKER_BASE_RE, expand=False)
     # Ensure presence
     for c in want:
         if c not in out.columns:
@@ -27,10 +30,12 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
 def _dedupe_global(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return df
-    # Same policy as your current builder: drop dup by (country, ticker_base) then (country, name)
-    df = df.drop_duplicates(subset=["country","ticker_base"], keep="first")
-    df = df.drop_duplicates(subset=["country","name"], keep="first")
-    return df.reset_index(drop=True)
+    # Same policy as your current builder: drop dup by (country, ticker_base) then (country, name).
+    # Built as one keep-mask (the name pass only sees rows that survived the code pass),
+    # so only the final frame is materialized.
+    keep = ~df.duplicated(subset=["country","ticker_base"], keep="first").to_numpy()
+    keep[keep] = ~df.loc[keep, ["country","name"]].duplicated(keep="first").to_numpy()
+    return df.loc[keep].reset_index(drop=True)
 
 @dataclass
 class BuildUniverseService(UniverseBuilder):
@@ -41,8 +46,14 @@ class BuildUniverseService(UniverseBuilder):
         prov: Dict[str, Any] = {}
         frames: List[pd.DataFrame] = []
 
-        for src in self.sources:
-            df = _normalize_columns(src.fetch())
+        # sources are independent network fetches: run them side by side, keep input order
+        def _fetch(src: TickerSource) -> pd.DataFrame:
+            return _normalize_columns(src.fetch())
+
+        with ThreadPoolExecutor(max_workers=max(1, len(self.sources))) as ex:
+            fetched = list(ex.map(_fetch, self.sources))
+
+        for src, df in zip(self.sources, fetched):
             meta = {
                 "source": getattr(src, "source_label", src.__class__.__name__),
                 "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
@@ -28,6 +28,7 @@ def _find_repo_root(start: Path) -> Path:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build Net Net global universe (Clean Architecture).")
     parser.add_argument("--root", type=str, default=None, help="Project root path (directory that contains /tools and /application).")
+    parser.add_argument("--force-refresh", action="store_true", help="Re-fetch every listing even if today's output already exists.")
     args = parser.parse_args()
 
     if args.root:
@@ -44,9 +45,9 @@ def main() -> None:
 
     repo = CsvUniverseWriterRepository(project_root)
     sources = [
-        USSecSource(project_root),
-        JPJpxSource(project_root),
-        HKHKEXSource(project_root),
+        USSecSource(project_root, force_refresh=args.force_refresh),
+        JPJpxSource(project_root, force_refresh=args.force_refresh),
+        HKHKEXSource(project_root, force_refresh=args.force_refresh),
     ]
     svc = BuildUniverseService(sources=sources, repo=repo)
     result = svc.run()
@@ -27,6 +27,10 @@ def main():
     ap.add_argument("--limit", type=int)
     ap.add_argument("--prices-only", action="store_true")
     ap.add_argument("--max-fs-age-days", type=int, default=730)
+    ap.add_argument("--cache-ttl-hours", type=float, default=None,
+                    help="skip refetch when the cached record was fetched within N hours (default: NCAV_TTL_HOURS, 24; 0 disables)")
+    ap.add_argument("--output-format", choices=["csv", "parquet"], default="csv",
+                    help="format of the full ncav_all table (parquet requires pyarrow)")
     ap.add_argument("--verbose", "-v", action="count", default=1,
                     help="-v INFO, -vv DEBUG, -vvv TRACE-like (DEBUG+extra)")
     ap.add_argument("--log-every", type=int, default=10, help="log fundamentals progress every N tickers")
@@ -44,7 +48,7 @@ def main():
     universe = CsvUniverseLoaderRepository(Path(args.tickers_csv))
     fundamentals = NcavCacheRepository()
     prices = YahooPriceClient()
-    fx = YahooFxProvider()
+    fx = YahooFxProvider(cache_dir=CACHE_ROOT / "cache" / "fx")
     out = LocalShortlistRepository(CACHE_ROOT)
 
     svc = BuildShortlistService(universe, fundamentals, prices, fx, out, logger=logger, log_every=args.log_every)
@@ -55,6 +59,8 @@ def main():
         max_fs_age_days=args.max_fs_age_days,
         prices_only=args.prices_only,
         limit=args.limit,
+        cache_ttl_hours=args.cache_ttl_hours,
+        output_format=args.output_format,
     )
     meta = svc.run(cfg)
     logger.info("Shortlist done → %s", meta["outputs"]["ncav_shortlist_csv"])
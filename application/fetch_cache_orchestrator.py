@@ -2,11 +2,19 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, Dict, List
+import logging
+import tempfile
+from typing import Callable, Iterable, Optional, Dict, List
+
+import pandas as pd
 
 from infrastructure.runners.python_script_runner import PythonScriptRunner
+from infrastructure.config.paths import RepoPaths
+from infrastructure.repositories.json_pack import PACK_NAME, build_pack
 from application.market_registry import default_registry
 
+_log = logging.getLogger("fetch_cache")
+
 
 @dataclass
 class FetchConfig:
@@ -37,6 +45,35 @@ class FetchCacheOrchestrator:
         # registry builds the list of MarketJob objects (US_CORE, NON_US, US_INSIDERS, ...)
         self.jobs = default_registry(self.cfg.tools_dir)
 
+    def _filtered_shortlist(
+        self,
+        include_filter: Optional[Callable[[str], bool]],
+        cache: Dict[object, Path],
+        shortlist: Optional[pd.DataFrame],
+        tmp_dir: Path,
+    ) -> Path:
+        """
+        Path of the shortlist restricted by include_filter.
+
+        The filter is evaluated once per unique ticker and the rows written to
+        tmp_dir/<shortlist>.<filter>.csv; jobs sharing a filter reuse the same file.
+        """
+        src = self.cfg.shortlist_csv
+        if include_filter is None or shortlist is None or "ticker" not in shortlist.columns:
+            return src
+        if include_filter in cache:
+            return cache[include_filter]
+
+        tickers = shortlist["ticker"].astype(str)
+        keep = {t: bool(include_filter(t)) for t in pd.unique(tickers)}
+        mask = tickers.map(keep).to_numpy(dtype=bool)
+
+        tag = getattr(include_filter, "__name__", "filtered")
+        out = tmp_dir / f"{src.stem}.{tag}{src.suffix}"
+        shortlist.loc[mask].to_csv(out, index=False)
+        cache[include_filter] = out
+        return out
+
     def run_all(
         self,
         verbose: bool = False,
@@ -58,28 +95,55 @@ class FetchCacheOrchestrator:
         skip_set = {n.upper() for n in skip} if skip else set()
         extra_args = extra_args or {}
 
-        for job in self.jobs:
-            name = job.name
-            name_upper = name.upper()
-
-            # filter by "only" / "skip" if provided
-            if only_set is not None and name_upper not in only_set:
-                continue
-            if name_upper in skip_set:
-                continue
-
-            # build script arguments from the registry entry
-            args = list(job.args_builder(self.cfg.shortlist_csv))
-
-            # attach any extra args for this job (e.g. --force)
-            extra = extra_args.get(name_upper)
-            if extra:
-                args.extend(extra)
-
-            # propagate verbosity flag if requested and not already present
-            if verbose and "--verbose" not in args:
-                args.append("--verbose")
-
-            rc = self.runner.run(job.script_rel, args)
-            if rc != 0:
-                raise SystemExit(f"{name} failed (rc={rc})")
+        # read the shortlist once; each distinct include_filter gets its own filtered copy
+        shortlist = (
+            pd.read_csv(self.cfg.shortlist_csv, dtype=str, keep_default_na=False)
+            if self.cfg.shortlist_csv.exists() else None
+        )
+        filtered: Dict[object, Path] = {}
+        # filtered copies live only for this run, not next to the shortlist
+        with tempfile.TemporaryDirectory(prefix="fetch_cache_") as tmp:
+            for job in self.jobs:
+                name = job.name
+                name_upper = name.upper()
+
+                # filter by "only" / "skip" if provided
+                if only_set is not None and name_upper not in only_set:
+                    continue
+                if name_upper in skip_set:
+                    continue
+
+                # build script arguments from the registry entry; only jobs that
+                # actually pass the shortlist on get a filtered copy of it
+                src = self.cfg.shortlist_csv
+                args = list(job.args_builder(src))
+                if str(src) in args:
+                    job_shortlist = self._filtered_shortlist(job.include_filter, filtered, shortlist, Path(tmp))
+                    if job_shortlist != src:
+                        args = list(job.args_builder(job_shortlist))
+
+                # attach any extra args for this job (e.g. --force)
+                extra = extra_args.get(name_upper)
+                if extra:
+                    args.extend(extra)
+
+                # propagate verbosity flag if requested and not already present
+                if verbose and "--verbose" not in args:
+                    args.append("--verbose")
+
+                rc = self.runner.run(job.script_rel, args)
+                if rc != 0:
+                    raise SystemExit(f"{name} failed (rc={rc})")
+
+        self._refresh_packs()
+
+    def _refresh_packs(self) -> None:
+        """
+        Rebuild the packed copies of the core/insider caches so screening sees
+        what the jobs just wrote. Only directories that already have a pack
+        (opted in via infrastructure/repositories/json_pack.py) are touched.
+        """
+        paths = RepoPaths.from_root(self.cfg.repo_root)
+        for d in (paths.cache_core, paths.cache_insider):
+            if (d / PACK_NAME).exists():
+                _log.info("rebuilt JSON pack %s", build_pack(d))
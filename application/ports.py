@@ -43,11 +43,14 @@ class ShortlistUniverseRepository(Protocol):
 
 class FundamentalsRepository(Protocol):
     """Port: supply NCAV fundamentals, from cache or by fetching/updating."""
-    def get_or_update(self, house_ticker: str, fetch_timeout: int) -> Dict[str, Any]:
+    def get_or_update(self, house_ticker: str, fetch_timeout: int,
+                      max_age_hours: Optional[float] = None) -> Dict[str, Any]:
         """
         Return a dict with keys compatible with shortlist pipeline:
           ticker, y_symbol, fs_date, currency, assets_current, liab_total, ncav,
           shares_out, ncav_ps, data_age_days, fs_source, fs_selected_col, note
+        A record fetched less than max_age_hours ago is returned without refetching
+        (None -> the repository's default, 0 -> always refetch).
         """
         ...
 
@@ -73,15 +76,18 @@ class FxProvider(Protocol):
 class ShortlistRepository(Protocol):
     """Port: persist shortlist outputs (all rows, filtered shortlist, metadata)."""
     def save_all(self, df: pd.DataFrame): ...
+    def save_all_parquet(self, df: pd.DataFrame): ...
     def save_shortlist(self, df: pd.DataFrame): ...
     def save_meta(self, payload: Dict[str, Any]): ...
 
 @dataclass(frozen=True)
 class ShortlistConfig:
     """Configuration for the shortlist use case."""
-    max_workers: int = 4
+    max_workers: int = 4  # fundamentals fetches are further capped by NCAV_FETCH_WORKERS (tools/ncav_cache.py)
     fetch_timeout: int = 15
     prices_batch: int = 40
     max_fs_age_days: int = 730
     prices_only: bool = False
     limit: Optional[int] = None
+    cache_ttl_hours: Optional[float] = None  # reuse records fetched within N hours; None -> repository default, 0 disables
+    output_format: str = "csv"  # "csv" or "parquet" for the full ncav_all table; the shortlist stays CSV
@@ -1,15 +1,21 @@
 # application/screening_service.py
 
 from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol, List, Dict, Any, Optional
 
 from domain.models.valuation_result import ValuationResult
-from domain.services.netnet_analysis import analyze_one_ticker
+from domain.services.netnet_analysis import analyze_one_ticker, apply_flags_batch
 
+# tickers per process-pool task (amortizes pickling), and the size below which pools aren't worth it
+_ANALYSIS_CHUNK = 32
+_MIN_PARALLEL = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class ShortlistItem:
     ticker: str
     last_price: float
@@ -44,12 +50,27 @@ class ValuationWriter(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreeningSummary:
     count: int
     output_paths: Dict[str, str]
 
 
+def _analyze_chunk(task) -> List[ValuationResult]:
+    # top-level so a process pool can pickle it; fx_rates travels once per chunk
+    jobs, fx_rates = task
+    return [
+        analyze_one_ticker(
+            core=core,
+            insider_blob=insider_blob,
+            last_price=last_price,
+            fx_rates=fx_rates,
+            with_flags=False,
+        )
+        for core, insider_blob, last_price in jobs
+    ]
+
+
 class ScreeningService:
     def __init__(
         self,
@@ -58,31 +79,49 @@ class ScreeningService:
         insider_repo: InsiderRepository,
         fx_provider: FxProvider,
         writer: ValuationWriter,
+        max_workers: int = 16,
+        analysis_processes: Optional[int] = None,
     ) -> None:
         self._shortlist_repo = shortlist_repo
         self._core_repo = core_repo
         self._insider_repo = insider_repo
         self._fx_provider = fx_provider
         self._writer = writer
+        self._max_workers = max(1, int(max_workers or 1))
+        # None -> one per CPU; 1 keeps analysis in-process
+        self._analysis_processes = max(1, int(analysis_processes or os.cpu_count() or 1))
 
     def screen_shortlist(self, shortlist_path: Path) -> ScreeningSummary:
         items = self._shortlist_repo.load_shortlist(shortlist_path)
         fx_rates = self._fx_provider.get_rates_ccy_to_usd()
 
-        results: List[ValuationResult] = []
-        for item in items:
-            core = self._core_repo.load_core(item.ticker)
-            if not core:
-                continue
-
-            insider_blob = self._insider_repo.load_insiders(item.ticker) or {}
-            valuation = analyze_one_ticker(
-                core=core,
-                insider_blob=insider_blob,
-                last_price=item.last_price,
-                fx_rates=fx_rates,
-            )
-            results.append(valuation)
+        # batch the cache reads: core and insider loads for every ticker are
+        # submitted up front so both repos' I/O overlaps; ex.map keeps order
+        tickers = [item.ticker for item in items]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as ex:
+            core_it = ex.map(self._core_repo.load_core, tickers)
+            insider_it = ex.map(self._insider_repo.load_insiders, tickers)
+            cores = list(core_it)
+            insiders = list(insider_it)
+
+        jobs = [
+            (core, insider_blob or {}, item.last_price)
+            for item, core, insider_blob in zip(items, cores, insiders)
+            if core
+        ]
+
+        # analysis is pure CPU-bound Python, so spread chunks over processes;
+        # ex.map keeps chunk order, hence shortlist order
+        results: List[ValuationResult]
+        if self._analysis_processes > 1 and len(jobs) >= _MIN_PARALLEL:
+            tasks = [(jobs[k : k + _ANALYSIS_CHUNK], fx_rates) for k in range(0, len(jobs), _ANALYSIS_CHUNK)]
+            with ProcessPoolExecutor(max_workers=min(self._analysis_processes, len(tasks))) as ex:
+                results = [v for part in ex.map(_analyze_chunk, tasks) for v in part]
+        else:
+            results = _analyze_chunk((jobs, fx_rates))
+
+        # flags over the whole result set in one vectorized pass
+        apply_flags_batch(results)
 
         paths = self._writer.write(results, fx_rates_ccy_to_usd=fx_rates)
         return ScreeningSummary(count=len(results), output_paths=paths)
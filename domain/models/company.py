@@ -3,14 +3,14 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompanyId:
     ticker: str            # "OP.US"
     cik: Optional[str]     # "0001869467" for US, None for JP/HK
     country_iso: str       # "US", "JP", "HK", ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompanyProfile:
     name: str                          # "OceanPal Inc."
     exchange: Optional[str]            # e.g. "NASDAQ", "TSE", "HKEX" (None in sample)
@@ -24,7 +24,7 @@ class CompanyProfile:
     employees: Optional[int]           # headcount if we have it
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Company:
     id: CompanyId
     profile: CompanyProfile
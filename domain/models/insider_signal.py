@@ -14,7 +14,7 @@ SignalType = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class InsiderSignal:
     ticker: str
     signal: SignalType
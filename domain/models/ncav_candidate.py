@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class NcavCandidate:
     """
     Result of phase 1 (build_ncav_shortlist):
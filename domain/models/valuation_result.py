@@ -1,8 +1,8 @@
 # domain/models/valuation_result.py
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Optional, List
 
-@dataclass
+@dataclass(slots=True)
 class ValuationResult:
     # --- Identity / listing info ---
     ticker: str
@@ -75,3 +75,35 @@ class ValuationResult:
     passes_price_to_ncav_rule: Optional[bool]  # True if price_to_ncavps <= ~0.67
     has_recent_buyback: Optional[bool]         # True if buyback in last 3y < -5%
     has_recent_dilution: Optional[bool]        # True if issuance in last 3y > 8%
+
+
+VALUATION_FIELDS = tuple(f.name for f in fields(ValuationResult))
+
+
+class ValuationTable:
+    """
+    Column-major (one list per field) view of many ValuationResult rows.
+
+    Built from finished results by the flag pass and the report writer;
+    aggregates and export work per column, to_records() gives plain dicts.
+    """
+    __slots__ = ("columns", "_n")
+
+    def __init__(self, columns: Dict[str, List[Any]]) -> None:
+        self.columns = columns
+        self._n = len(next(iter(columns.values()), []))
+
+    @classmethod
+    def from_results(cls, valuations: Iterable[ValuationResult]) -> "ValuationTable":
+        valuations = list(valuations)
+        return cls({name: [getattr(v, name) for v in valuations] for name in VALUATION_FIELDS})
+
+    def __len__(self) -> int:
+        return self._n
+
+    def column(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [dict(zip(VALUATION_FIELDS, vals))
+                for vals in zip(*(self.columns[name] for name in VALUATION_FIELDS))]
@@ -1,25 +1,36 @@
 # domain/services/balance_sheet_metrics.py --> Show how we calculate NCAV, solvency, and liquidity
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 
 from domain.services.fx_utils import convert_between
 from domain.services.periods import all_periods_sorted, detect_period_currency
 
 
+_NULL_STRS = frozenset({"", "nan", "none"})
+
+
 def safe_float(x: Any) -> Optional[float]:
     """
     Convert x to float if possible, else return None.
     """
+    # branch on type so the common numeric case never enters try/except
+    if x is None:
+        return None
+    t = type(x)
+    if t is float:
+        return x
+    if t is int or isinstance(x, (int, float)):
+        return float(x)
+    # strings and anything else (numpy ints, Decimal, ...) go through their text form
     try:
-        if x is None:
-            return None
-        if isinstance(x, (int, float)):
-            return float(x)
-        s = str(x).strip()
-        if s == "" or s.lower() == "nan" or s.lower() == "none":
-            return None
-        return float(s)
+        s = (x if t is str else str(x)).strip()
     except Exception:
         return None
+    if s.lower() in _NULL_STRS:
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
 
 
 def _extract_val(raw: Any) -> Optional[float]:
@@ -33,6 +44,26 @@ def _extract_val(raw: Any) -> Optional[float]:
     return safe_float(raw)
 
 
+_BALANCE_CONTAINERS = ("balance", "balance_sheet", "bs")
+_BALANCE_KEYS = ("assets_current", "liab_current", "assets_total", "liab_total")
+
+
+def _balance_sources(period: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Dicts to search for balance keys, in priority order: balance-like containers, then the period itself.
+    """
+    out = [c for c in (period.get(k) for k in _BALANCE_CONTAINERS) if isinstance(c, dict)]
+    out.append(period)
+    return out
+
+
+def _lookup(sources: List[Dict[str, Any]], key: str) -> Optional[float]:
+    for src in sources:
+        if key in src:
+            return _extract_val(src[key])
+    return None
+
+
 def get_balance_value(period: Dict[str, Any], key: str) -> Optional[float]:
     """
     Safe pull from balance sheet dict in a snapshot period.
@@ -44,24 +75,31 @@ def get_balance_value(period: Dict[str, Any], key: str) -> Optional[float]:
     """
     if not period:
         return None
+    return _lookup(_balance_sources(period), key)
 
-    # Check balance-like containers first
-    for container_key in ["balance", "balance_sheet", "bs"]:
-        bal = period.get(container_key)
-        if isinstance(bal, Dict) and key in bal:
-            return _extract_val(bal.get(key))
-
-    # Fallback to flat on period
-    if key in period:
-        return _extract_val(period.get(key))
 
-    return None
+def read_balance(
+    period: Optional[Dict[str, Any]],
+) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+    """
+    (assets_current, liab_current, assets_total, liab_total) in one pass,
+    resolving the period's containers once instead of per key.
+    """
+    if not period:
+        return None, None, None, None
+    sources = _balance_sources(period)
+    ca, cl, ta, tl = (_lookup(sources, k) for k in _BALANCE_KEYS)
+    return ca, cl, ta, tl
 
 
-def listing_ccy_for_ticker(core: Dict[str, Any]) -> Optional[str]:
+def listing_ccy_for_ticker(
+    core: Dict[str, Any],
+    periods: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[str]:
     """
     Figure out what currency the listing / quote is in.
     Try meta then fallback per-period currency.
+    Pass `periods` (all_periods_sorted(core)) if already computed to skip re-sorting.
     """
     meta = core.get("meta", {})
     ccy = meta.get("currency") or meta.get("listing_currency")
@@ -69,7 +107,8 @@ def listing_ccy_for_ticker(core: Dict[str, Any]) -> Optional[str]:
         return str(ccy).upper()
 
     # fallback: sniff from most recent period
-    periods = all_periods_sorted(core)
+    if periods is None:
+        periods = all_periods_sorted(core)
     if periods:
         p0 = periods[0]
         det = detect_period_currency(p0)
@@ -83,8 +122,13 @@ def current_ratio(period: Dict[str, Any]) -> Optional[float]:
     """
     current assets / current liabilities
     """
-    ca = get_balance_value(period, "assets_current")
-    cl = get_balance_value(period, "liab_current")
+    return current_ratio_from_values(
+        get_balance_value(period, "assets_current"),
+        get_balance_value(period, "liab_current"),
+    )
+
+
+def current_ratio_from_values(ca: Optional[float], cl: Optional[float]) -> Optional[float]:
     if ca is None or cl is None or cl == 0:
         return None
     return float(ca) / float(cl)
@@ -95,8 +139,13 @@ def de_ratio(period: Dict[str, Any]) -> Optional[float]:
     total liabilities / (total assets - total liabilities)
     This is 'Debt-to-Equity' in Graham-ish loose sense.
     """
-    ta = get_balance_value(period, "assets_total")
-    tl = get_balance_value(period, "liab_total")
+    return de_ratio_from_values(
+        get_balance_value(period, "assets_total"),
+        get_balance_value(period, "liab_total"),
+    )
+
+
+def de_ratio_from_values(ta: Optional[float], tl: Optional[float]) -> Optional[float]:
     if ta is None or tl is None:
         return None
     equity = float(ta) - float(tl)
@@ -113,10 +162,25 @@ def ncav_total_native(period: Dict[str, Any]) -> Optional[float]:
     If we don't have current assets (e.g. some SEC facts), we fall back
     to total assets as a rough approximation.
     """
-    ca = get_balance_value(period, "assets_current")
+    if not period:
+        return None
+    sources = _balance_sources(period)
+    ca = _lookup(sources, "assets_current")
+    if ca is None:
+        ca = _lookup(sources, "assets_total")
+    return ncav_from_values(ca, None, _lookup(sources, "liab_total"))
+
+
+def ncav_from_values(
+    ca: Optional[float],
+    ta: Optional[float],
+    tl: Optional[float],
+) -> Optional[float]:
+    """
+    NCAV from already-read balance values (total assets stands in for missing current assets).
+    """
     if ca is None:
-        ca = get_balance_value(period, "assets_total")
-    tl = get_balance_value(period, "liab_total")
+        ca = ta
     if ca is None or tl is None:
         return None
     return float(ca) - float(tl)
@@ -143,7 +207,16 @@ def compute_ncav_ps_from_period(
     """
     NCAV per share in native currency.
     """
-    total_ncav = ncav_total_native(period)
+    return ncav_ps_from_total(ncav_total_native(period), shares_out)
+
+
+def ncav_ps_from_total(
+    total_ncav: Optional[float],
+    shares_out: Optional[float],
+) -> Optional[float]:
+    """
+    NCAV per share from an already computed NCAV total (skips re-reading the period).
+    """
     if total_ncav is None:
         return None
     if shares_out is None or shares_out == 0:
@@ -2,16 +2,47 @@
 import pandas as pd
 from domain.models.company import CompanyId, CompanyProfile, Company
 
+try:  # optional: Arrow's CSV reader is much faster on big universe files
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+_COLS = ("ticker", "country", "cik", "name")
+
+
+def _read_columns(path: str) -> dict:
+    """ticker/country/cik/name as plain lists of str (None where blank); cik may be absent."""
+    if pacsv is not None:
+        tbl = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(
+            column_types={c: pa.string() for c in _COLS},
+            include_columns=list(_COLS),
+            include_missing_columns=True,
+            strings_can_be_null=True,
+        ))
+        return {c: tbl.column(c).to_pylist() for c in _COLS}
+
+    # read ids as text so CIKs keep their leading zeros
+    df = pd.read_csv(path, usecols=lambda c: c in _COLS, dtype={c: str for c in _COLS})
+    cols = {c: df[c].tolist() for c in _COLS if c in df.columns}
+    cols.setdefault("cik", [None] * len(df))
+    return cols
+
+
 def load_companies(path: str) -> list[Company]:
-    df = pd.read_csv(path)
+    cols = _read_columns(path)
+    countries = cols["country"]
+    ciks = [k if isinstance(k, str) else "" for k in cols["cik"]]
+    is_us = [c == "US" for c in countries]
+
     companies = []
-    for _, r in df.iterrows():
+    for t, c, k, nm, us in zip(cols["ticker"], countries, ciks, cols["name"], is_us):
         cid = CompanyId(
-            ticker=r["ticker"],
-            cik=None if r["country"] != "US" else str(r.get("cik", "")),
-            country_iso=r["country"],
+            ticker=t,
+            cik=k if us else None,
+            country_iso=c,
         )
-        profile = CompanyProfile(name=r["name"], exchange=None,
+        profile = CompanyProfile(name=nm, exchange=None,
                                  sector=None, industry=None,
                                  sic=None, entity_type=None,
                                  website=None, ipo_date=None,
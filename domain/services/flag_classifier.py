@@ -1,5 +1,29 @@
 #domain/services/flag_classifier.py
-from typing import Optional, Tuple, List
+import operator
+from typing import Dict, Optional, Tuple, List
+
+import numpy as np
+
+# (label, metric, op, threshold) in the order flags are emitted; a missing metric never fires
+_GREEN_RULES = (
+    ("Trading ≤ 2/3 NCAV", "p_to_ncav", operator.le, 2.0 / 3.0),
+    ("Current ratio ≥ 2", "cr", operator.ge, 2.0),
+    ("Meaningful buyback in last 3y", "max_buyback_3y", operator.lt, -0.05),
+    ("NCAV stable YoY or improving", "ncav_yoy", operator.ge, 0),
+)
+_RED_RULES = (
+    ("Financials are stale", "is_outdated", operator.eq, True),
+    ("High leverage", "de", operator.gt, 1.5),
+    ("NCAV down QoQ >20%", "ncav_qoq", operator.lt, -0.2),
+    ("NCAV down HoH >20%", "ncav_hoh", operator.lt, -0.2),
+    ("NCAV down YoY >20%", "ncav_yoy", operator.lt, -0.2),
+    ("Dilution QoQ >5%", "dil_qoq", operator.gt, 0.05),
+    ("Dilution HoH >5%", "dil_hoh", operator.gt, 0.05),
+    ("Dilution YoY >5%", "dil_yoy", operator.gt, 0.05),
+    ("Issued >8% in last 12m", "max_dil_1y", operator.gt, 0.08),
+    ("Issued >20% in last 3y", "max_issue_3y", operator.gt, 0.20),
+)
+
 def classify_flags(
     price_to_ncavps: Optional[float],
     cr: Optional[float],
@@ -29,52 +53,43 @@ def classify_flags(
           - NCAV melting fast
           - Leverage scary
     """
-    green: List[str] = []
-    red: List[str] = []
-
-    # value
-    if price_to_ncavps is not None and price_to_ncavps <= 2.0 / 3.0:
-        green.append("Trading ≤ 2/3 NCAV")
-
-    # liquidity
-    if cr is not None and cr >= 2.0:
-        green.append("Current ratio ≥ 2")
-
-    # capital discipline
-    if max_buyback_3y is not None and max_buyback_3y < -0.05:
-        green.append("Meaningful buyback in last 3y")
-
-    # NCAV stability/improvement
-    # if NCAV change YoY >= 0 -> not burning
-    if ncav_yoy is not None and ncav_yoy >= 0:
-        green.append("NCAV stable YoY or improving")
+    metrics = {
+        "p_to_ncav": price_to_ncavps,
+        "cr": cr,
+        "de": de,
+        "ncav_qoq": ncav_qoq,
+        "ncav_hoh": ncav_hoh,
+        "ncav_yoy": ncav_yoy,
+        "dil_qoq": dil_qoq,
+        "dil_hoh": dil_hoh,
+        "dil_yoy": dil_yoy,
+        "max_dil_1y": max_dil_1y,
+        "max_issue_3y": max_issue_3y,
+        "max_buyback_3y": max_buyback_3y,
+        "is_outdated": bool(is_outdated),
+    }
+    green = [label for label, key, op, thr in _GREEN_RULES
+             if metrics[key] is not None and op(metrics[key], thr)]
+    red = [label for label, key, op, thr in _RED_RULES
+           if metrics[key] is not None and op(metrics[key], thr)]
+    return green, red
 
-    # stale data
-    if is_outdated:
-        red.append("Financials are stale")
 
-    # leverage
-    if de is not None and de > 1.5:
-        red.append("High leverage")
-
-    # NCAV burn
-    # if NCAV down more than ~20% recently -> danger
-    for label, chg in [("QoQ", ncav_qoq), ("HoH", ncav_hoh), ("YoY", ncav_yoy)]:
-        if chg is not None and chg < -0.2:
-            red.append(f"NCAV down {label} >20%")
-
-    # dilution recent
-    # If shares_out jumped >5% in recent windows, flag
-    for label, dil in [("QoQ", dil_qoq), ("HoH", dil_hoh), ("YoY", dil_yoy)]:
-        if dil is not None and dil > 0.05:
-            red.append(f"Dilution {label} >5%")
-
-    # worst 12m
-    if max_dil_1y is not None and max_dil_1y > 0.08:
-        red.append("Issued >8% in last 12m")
-
-    # worst 3y
-    if max_issue_3y is not None and max_issue_3y > 0.20:
-        red.append("Issued >20% in last 3y")
+def classify_flags_batch(
+    metrics: Dict[str, np.ndarray],
+) -> Tuple[List[List[str]], List[List[str]]]:
+    """
+    Same rules as classify_flags over whole columns at once.
 
-    return green, red
\ No newline at end of file
+    metrics maps the rule keys ("p_to_ncav", "cr", "de", "ncav_qoq", ...) to
+    equal-length float arrays (NaN = missing) plus a bool "is_outdated" array.
+    Each rule is one vectorized comparison; Python only touches rows that fire.
+    """
+    n = len(metrics["is_outdated"])
+    green: List[List[str]] = [[] for _ in range(n)]
+    red: List[List[str]] = [[] for _ in range(n)]
+    for rules, out in ((_GREEN_RULES, green), (_RED_RULES, red)):
+        for label, key, op, thr in rules:
+            for i in np.flatnonzero(op(metrics[key], thr)):
+                out[i].append(label)
+    return green, red
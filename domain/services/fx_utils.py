@@ -1,6 +1,18 @@
 #domain/services/fx_utils.py --> currency helper
 from __future__ import annotations
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, NewType, Optional
+
+# canonical (upper-cased, alias-resolved) currency code, e.g. "CNY" for "rmb"
+CurrencyCode = NewType("CurrencyCode", str)
+
+_CCY_ALIASES: Dict[str, str] = {
+    "RMB": "CNY",
+    "CNH": "CNY",  # treat offshore/onshore RMB the same for NCAV work
+}
+
+
+@lru_cache(maxsize=128)
 def _ccy_alias(ccy: str) -> str:
     """
     Normalize weird Yahoo codes etc. to standard ISO-ish tickers.
@@ -10,11 +22,17 @@ def _ccy_alias(ccy: str) -> str:
     if not ccy:
         return ccy
     ccy_up = ccy.upper()
-    aliases = {
-        "RMB": "CNY",
-        "CNH": "CNY",  # treat offshore/onshore RMB the same for NCAV work
-    }
-    return aliases.get(ccy_up, ccy_up)
+    return _CCY_ALIASES.get(ccy_up, ccy_up)
+
+
+def normalize_ccy(ccy: Optional[str]) -> Optional[CurrencyCode]:
+    """
+    Canonical code for a raw currency string; do this once at ingest and pass
+    assume_normalized=True to convert_between.
+    """
+    if ccy is None:
+        return None
+    return CurrencyCode(_ccy_alias(ccy))
 
 
 def _normalize_rates(raw_rates: Dict[str, float]) -> Dict[str, float]:
@@ -36,9 +54,11 @@ def convert_between(
     from_ccy: Optional[str],
     to_ccy: Optional[str],
     fx_rates: Dict[str, float],
+    assume_normalized: bool = False,
 ) -> Optional[float]:
     """
     Convert 'amount' in from_ccy to to_ccy using fx_rates.
+    With assume_normalized=True both codes must already be normalize_ccy() output.
     Assumptions:
         - fx_rates maps 1 unit of {ccy} -> USD
         - So: value_in_usd = amount * fx_rates[from_ccy]
@@ -51,24 +71,29 @@ def convert_between(
     if from_ccy is None or to_ccy is None:
         return None
 
-    from_ccy_norm = _ccy_alias(from_ccy)
-    to_ccy_norm = _ccy_alias(to_ccy)
+    if assume_normalized:
+        from_ccy_norm, to_ccy_norm = from_ccy, to_ccy
+    else:
+        from_ccy_norm = _ccy_alias(from_ccy)
+        to_ccy_norm = _ccy_alias(to_ccy)
 
     # same currency? no conversion
     if from_ccy_norm == to_ccy_norm:
         return float(amount)
 
     # fx_rates give us ccy -> USD
-    if from_ccy_norm not in fx_rates:
+    from_rate = fx_rates.get(from_ccy_norm)
+    if from_rate is None:
         return None
-    usd_val = float(amount) * float(fx_rates[from_ccy_norm])
+    usd_val = float(amount) * float(from_rate)
 
     if to_ccy_norm == "USD":
         return usd_val
 
     # need USD -> to_ccy
-    if to_ccy_norm not in fx_rates:
+    to_rate = fx_rates.get(to_ccy_norm)
+    if to_rate is None:
         return None
     # if 1 JPY = 0.0067 USD, then 1 USD = 1/0.0067 JPY
-    usd_to_target = 1.0 / float(fx_rates[to_ccy_norm])
+    usd_to_target = 1.0 / float(to_rate)
     return usd_val * usd_to_target
@@ -1,12 +1,32 @@
 # domain/services/insider_classifier.py
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from domain.services.balance_sheet_metrics import safe_float
 
+_MISSING = object()
+# shared result for the common no-data case; read-only so callers can't corrupt it
+_EMPTY_INSIDER: Tuple[str, Mapping[str, Optional[float]]] = (
+    "None",
+    MappingProxyType({
+        "total_buy_trades": None,
+        "total_sell_trades": None,
+        "net_shares_change": None,
+        "last_activity_date": None,
+        "source": None,
+    }),
+)
+
+
+def _first_present(blob: Dict[str, Any], key: str, fallback: str) -> Any:
+    # a present key wins even when falsy (0 trades); only a missing one falls back
+    v = blob.get(key, _MISSING)
+    return blob.get(fallback) if v is _MISSING else v
+
 
 def insider_signal(
     insider_blob: Optional[Dict[str, Any]]
-) -> Tuple[str, Dict[str, Optional[float]]]:
+) -> Tuple[str, Mapping[str, Optional[float]]]:
     """
     Collapse raw insider activity into headline string like:
     "Buy", "Sell", "Net Buy", "Net Sell", "None", "Unknown"
@@ -18,7 +38,7 @@ def insider_signal(
     Returns:
         (headline, stats_dict)
 
-    stats_dict keys:
+    stats_dict is read-only in the no-data case. Keys:
         total_buy_trades
         total_sell_trades
         net_shares_change  (positive => insiders accumulated)
@@ -26,33 +46,12 @@ def insider_signal(
         source
     """
     if not insider_blob:
-        return (
-            "None",
-            {
-                "total_buy_trades": None,
-                "total_sell_trades": None,
-                "net_shares_change": None,
-                "last_activity_date": None,
-                "source": None,
-            },
-        )
+        return _EMPTY_INSIDER
 
     # Try multiple key names for robustness
-    total_buy = safe_float(
-        insider_blob.get("total_buy_trades")
-        if "total_buy_trades" in insider_blob
-        else insider_blob.get("buys_count")
-    )
-    total_sell = safe_float(
-        insider_blob.get("total_sell_trades")
-        if "total_sell_trades" in insider_blob
-        else insider_blob.get("sells_count")
-    )
-    net_chg = safe_float(
-        insider_blob.get("net_shares_change")
-        if "net_shares_change" in insider_blob
-        else insider_blob.get("net_shares")
-    )
+    total_buy = safe_float(_first_present(insider_blob, "total_buy_trades", "buys_count"))
+    total_sell = safe_float(_first_present(insider_blob, "total_sell_trades", "sells_count"))
+    net_chg = safe_float(_first_present(insider_blob, "net_shares_change", "net_shares"))
     last_dt = insider_blob.get("last_activity_date") or insider_blob.get("as_of")
     src = insider_blob.get("source")
 
@@ -1,76 +1,84 @@
 # domain/services/netnet_analysis.py
+from typing import List
+
+import numpy as np
+
 from domain.services.periods import all_periods_sorted
 from domain.services.balance_sheet_metrics import (
-    current_ratio,
-    de_ratio,
+    read_balance,
+    current_ratio_from_values,
+    de_ratio_from_values,
+    ncav_from_values,
     ncav_total_native,
-    compute_ncav_ps_from_period,
+    ncav_ps_from_total,
     listing_ccy_for_ticker,
-    safe_float,
 )
-from domain.services.fx_utils import convert_between
+from domain.services.fx_utils import convert_between, normalize_ccy
+from domain.services.period_accessors import get_shares_out as _extract_shares_out
 from domain.services.trend_analysis import (
     pct_change,
     max_dilution_within_1y,
     max_change_within_3y,
-    pair_for_qoq,
-    pair_for_hoh,
-    pair_for_yoy,
+    trend_pairs,
 )
 from domain.services.data_quality import assess_staleness
 from domain.services.insider_classifier import insider_signal
-from domain.services.flag_classifier import classify_flags
-from domain.models.valuation_result import ValuationResult
-
-
-def _extract_shares_out(period):
+from domain.services.flag_classifier import classify_flags, classify_flags_batch
+from domain.models.valuation_result import ValuationResult, ValuationTable
+
+
+# flag rule key -> ValuationResult field
+_FLAG_FIELDS = {
+    "p_to_ncav": "price_to_ncavps",
+    "cr": "current_ratio",
+    "de": "debt_to_equity",
+    "ncav_qoq": "ncav_change_qoq",
+    "ncav_hoh": "ncav_change_hoh",
+    "ncav_yoy": "ncav_change_yoy",
+    "dil_qoq": "dilution_qoq",
+    "dil_hoh": "dilution_hoh",
+    "dil_yoy": "dilution_yoy",
+    "max_dil_1y": "max_dilution_1y",
+    "max_issue_3y": "max_issue_3y",
+    "max_buyback_3y": "max_buyback_3y",
+}
+
+
+def apply_flags_batch(valuations: List[ValuationResult]) -> None:
     """
-    Try several locations / shapes for shares_out.
-    Works with:
-        period["shares_out"]
-        period["balance"]["shares_out"]["val"]
-        period["shares_outstanding"], etc.
+    Fill green_flags/red_flags for many results with one vectorized pass.
     """
-    if not period:
-        return None
-
-    containers = [period]
-    bal = period.get("balance")
-    if isinstance(bal, dict):
-        containers.append(bal)
-    meta = period.get("meta")
-    if isinstance(meta, dict):
-        containers.append(meta)
-
-    for container in containers:
-        for k in ["shares_out", "shares_outstanding", "basic_shares_out"]:
-            raw = container.get(k)
-            if raw is None:
-                continue
-            if isinstance(raw, dict) and "val" in raw:
-                raw = raw.get("val")
-            val = safe_float(raw)
-            if val is not None:
-                return val
-
-    return None
-
-
-def analyze_one_ticker(core, insider_blob, last_price, fx_rates) -> ValuationResult:
+    if not valuations:
+        return
+    table = ValuationTable.from_results(valuations)
+    # float64 arrays turn None into NaN, which never satisfies a rule
+    metrics = {
+        key: np.array(table.column(attr), dtype="float64")
+        for key, attr in _FLAG_FIELDS.items()
+    }
+    metrics["is_outdated"] = np.array(table.column("is_outdated"), dtype=bool)
+    greens, reds = classify_flags_batch(metrics)
+    for v, g, r in zip(valuations, greens, reds):
+        v.green_flags = g
+        v.red_flags = r
+
+
+def analyze_one_ticker(core, insider_blob, last_price, fx_rates, with_flags=True) -> ValuationResult:
     periods = all_periods_sorted(core)
     latest = periods[0] if periods else None
 
     # --- core balance sheet / NCAV ---
-    cr = current_ratio(latest)          # safely returns None if latest is None
-    de = de_ratio(latest)
-    ncav_native = ncav_total_native(latest)
+    ca, cl, ta, tl = read_balance(latest)   # all None if latest is None
+    cr = current_ratio_from_values(ca, cl)
+    de = de_ratio_from_values(ta, tl)
+    ncav_native = ncav_from_values(ca, ta, tl)
 
     shares = _extract_shares_out(latest)
-    ncav_ps = compute_ncav_ps_from_period(latest, shares)
+    ncav_ps = ncav_ps_from_total(ncav_native, shares)
 
     # cross-currency NCAV
-    listing_ccy = listing_ccy_for_ticker(core)
-    ncav_usd = convert_between(ncav_native, listing_ccy, "USD", fx_rates)
+    listing_ccy = listing_ccy_for_ticker(core, periods)
+    ncav_usd = convert_between(ncav_native, normalize_ccy(listing_ccy), "USD", fx_rates, assume_normalized=True)
 
     # valuation ratios
     price_to_ncavps = None
@@ -80,12 +88,18 @@ def analyze_one_ticker(core, insider_blob, last_price, fx_rates) -> ValuationRes
         margin_of_safety = 1.0 - price_to_ncavps
 
     # --- trend & dilution ---
-    q_pair = pair_for_qoq(periods)
-    h_pair = pair_for_hoh(periods)
-    y_pair = pair_for_yoy(periods)
+    q_pair, h_pair, y_pair = trend_pairs(periods)
+
+    # pairs usually reuse latest and each other; read each period's balance once
+    ncav_by_period = {id(latest): ncav_native} if latest else {}
 
     def ncav_from(p):
-        return ncav_total_native(p) if p else None
+        if not p:
+            return None
+        key = id(p)
+        if key not in ncav_by_period:
+            ncav_by_period[key] = ncav_total_native(p)
+        return ncav_by_period[key]
 
     ncav_qoq = pct_change(
         ncav_from(q_pair[1]) if q_pair else None,
@@ -126,21 +140,24 @@ def analyze_one_ticker(core, insider_blob, last_price, fx_rates) -> ValuationRes
     insider_headline, insider_stats = insider_signal(insider_blob)
 
     # --- flags (our policy knobs) ---
-    green_flags, red_flags = classify_flags(
-        price_to_ncavps,
-        cr,
-        de,
-        ncav_qoq,
-        ncav_hoh,
-        ncav_yoy,
-        dilution_qoq,
-        dilution_hoh,
-        dilution_yoy,
-        max_dil_1y,
-        max_issue_3y,
-        max_buyback_3y,
-        is_outdated,
-    )
+    # batch callers pass with_flags=False and run apply_flags_batch over all results
+    green_flags, red_flags = [], []
+    if with_flags:
+        green_flags, red_flags = classify_flags(
+            price_to_ncavps,
+            cr,
+            de,
+            ncav_qoq,
+            ncav_hoh,
+            ncav_yoy,
+            dilution_qoq,
+            dilution_hoh,
+            dilution_yoy,
+            max_dil_1y,
+            max_issue_3y,
+            max_buyback_3y,
+            is_outdated,
+        )
 
     # --- period label / fs date ---
     latest_fs_date = None
@@ -150,12 +167,13 @@ def analyze_one_ticker(core, insider_blob, last_price, fx_rates) -> ValuationRes
         latest_label = str(latest_fs_date)
 
     # --- package result ---
+    meta = core["meta"]
     return ValuationResult(
-        ticker=core["meta"]["ticker"],
-        exchange=core["meta"].get("exchange"),
-        country_iso=core["meta"].get("country_iso"),
-        sector=core["meta"].get("sector"),
-        industry=core["meta"].get("industry"),
+        ticker=meta["ticker"],
+        exchange=meta.get("exchange"),
+        country_iso=meta.get("country_iso"),
+        sector=meta.get("sector"),
+        industry=meta.get("industry"),
         reporting_currency=listing_ccy,
         latest_fs_date=latest_fs_date,
         current_ratio=cr,
@@ -163,7 +181,7 @@ def analyze_one_ticker(core, insider_blob, last_price, fx_rates) -> ValuationRes
         ncav_total_native=ncav_native,
         ncav_total_usd=ncav_usd,
         ncav_per_share=ncav_ps,
-        ncav_ps_shortlist=core["meta"].get("ncav_ps_shortlist"),
+        ncav_ps_shortlist=meta.get("ncav_ps_shortlist"),
         shares_out=shares,
         last_price=last_price,
         price_to_ncavps=price_to_ncavps,
@@ -190,7 +208,7 @@ def analyze_one_ticker(core, insider_blob, last_price, fx_rates) -> ValuationRes
         core_period_count=len(periods),
         insider_records=insider_stats.get("total_buy_trades"),
         latest_period_label=latest_label,
-        listing_note=core["meta"].get("listing_note"),
+        listing_note=meta.get("listing_note"),
         passes_price_to_ncav_rule=(
             price_to_ncavps is not None and price_to_ncavps <= (2.0 / 3.0)
         ),
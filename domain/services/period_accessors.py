@@ -0,0 +1,44 @@
+# domain/services/period_accessors.py --> field accessors shared by the NCAV and trend code
+from typing import Any, Dict, Optional
+
+from domain.services.balance_sheet_metrics import safe_float
+
+
+_SHARES_KEYS = ("shares_out", "shares_outstanding", "basic_shares_out")
+_SHARES_CONTAINERS = ("balance", "meta")
+
+
+def get_shares_out(period: Optional[Dict[str, Any]]) -> Optional[float]:
+    """
+    Try several locations / shapes for shares_out, first parseable value wins.
+    Works with:
+        period["shares_out"]
+        period["balance"]["shares_out"]["val"]
+        period["meta"]["shares_outstanding"], etc.
+    """
+    if not period:
+        return None
+
+    # fast path: a plain float right on the period
+    v = period.get("shares_out")
+    if type(v) is float:
+        return v
+
+    containers = [period]
+    for ck in _SHARES_CONTAINERS:
+        c = period.get(ck)
+        if isinstance(c, dict):
+            containers.append(c)
+
+    for container in containers:
+        for k in _SHARES_KEYS:
+            raw = container.get(k)
+            if raw is None:
+                continue
+            if isinstance(raw, dict) and "val" in raw:
+                raw = raw.get("val")
+            val = safe_float(raw)
+            if val is not None:
+                return val
+
+    return None
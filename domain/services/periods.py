@@ -2,6 +2,17 @@
 from __future__ import annotations
 from typing import Any, Optional, Dict, List, Tuple
 from datetime import datetime
+from functools import lru_cache
+import sys
+
+
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S",
+)
 
 
 def parse_date(d: Any) -> Optional[datetime]:
@@ -13,16 +24,18 @@ def parse_date(d: Any) -> Optional[datetime]:
         return None
     if isinstance(d, datetime):
         return d
+    return _parse_date_text(str(d).strip())
+
 
-    candidates = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d %H:%M:%S",
-    ]
-    ds = str(d).strip()
-    for fmt in candidates:
+@lru_cache(maxsize=8192)
+def _parse_date_text(ds: str) -> Optional[datetime]:
+    # statement dates repeat heavily (quarter ends), so each string is parsed once per process
+    if len(ds) == 10 and ds[4] == "-" and ds[7] == "-":
+        try:
+            return datetime.fromisoformat(ds)  # C fast path for the common YYYY-MM-DD
+        except ValueError:
+            pass
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(ds, fmt)
         except ValueError:
@@ -42,9 +55,9 @@ def _extract_period_date(period: Dict[str, Any]) -> Optional[datetime]:
     return None
 
 
-def _sort_periods_desc(periods: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _dated_desc(periods: List[Dict[str, Any]]) -> List[Tuple[datetime, Dict[str, Any]]]:
     """
-    Sort snapshots newest-first by their statement date.
+    (statement date, snapshot) pairs newest-first; snapshots without a date are dropped.
     """
     with_dates: List[Tuple[datetime, Dict[str, Any]]] = []
     for p in periods:
@@ -54,7 +67,14 @@ def _sort_periods_desc(periods: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
     # sort newest-first
     with_dates.sort(key=lambda tup: tup[0], reverse=True)
-    return [p for _, p in with_dates]
+    return with_dates
+
+
+def _sort_periods_desc(periods: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Sort snapshots newest-first by their statement date.
+    """
+    return [p for _, p in _dated_desc(periods)]
 
 
 def _get_period_list(core: Dict[str, Any], bucket: str) -> List[Dict[str, Any]]:
@@ -99,6 +119,16 @@ def annuals_sorted(core: Dict[str, Any]) -> List[Dict[str, Any]]:
     return _sort_periods_desc(a)
 
 
+@lru_cache(maxsize=256)
+def _ccy_code(val: str) -> str:
+    # a handful of distinct raw codes per run: upper-case once and share one interned object
+    return sys.intern(val.upper())
+
+
+def _period_ccy(val: Any) -> str:
+    return _ccy_code(val) if type(val) is str else str(val).upper()
+
+
 def detect_period_currency(period: Dict[str, Any]) -> Optional[str]:
     """
     Try to get the reporting currency from a period snapshot.
@@ -109,13 +139,13 @@ def detect_period_currency(period: Dict[str, Any]) -> Optional[str]:
     for k in ["currency", "ccy", "report_ccy", "reporting_currency"]:
         val = period.get(k)
         if val:
-            return str(val).upper()
+            return _period_ccy(val)
     # maybe balance has it
     bal = period.get("balance") or {}
     for k in ["currency", "ccy", "report_ccy", "reporting_currency"]:
         val = bal.get(k)
         if val:
-            return str(val).upper()
+            return _period_ccy(val)
     return None
 
 
@@ -123,21 +153,22 @@ def all_periods_sorted(core: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Combine quarterly + annual, dedupe by date signature, newest-first.
     """
-    q = quarters_sorted(core)
-    a = annuals_sorted(core)
-    buckets: Dict[str, Dict[str, Any]] = {}
-
-    def sig(p: Dict[str, Any]) -> Optional[str]:
-        dt = _extract_period_date(p)
-        return dt.strftime("%Y-%m-%d") if dt else None
-
-    for src in [q, a]:
-        for p in src:
-            s = sig(p)
-            if s and s not in buckets:
-                buckets[s] = p
-
-    # sort again newest-first
-    combos = list(buckets.values())
-    combos = _sort_periods_desc(combos)
-    return combos
+    q = _dated_desc(_get_period_list(core, "quarterly"))
+    a = _dated_desc(_get_period_list(core, "annual"))
+
+    # both sides are already newest-first: merge by calendar day, quarterly wins ties
+    out: List[Dict[str, Any]] = []
+    seen = set()
+    i = j = 0
+    while i < len(q) or j < len(a):
+        if j >= len(a) or (i < len(q) and q[i][0].toordinal() >= a[j][0].toordinal()):
+            dt, p = q[i]
+            i += 1
+        else:
+            dt, p = a[j]
+            j += 1
+        day = dt.toordinal()
+        if day not in seen:
+            seen.add(day)
+            out.append(p)
+    return out
@@ -1,8 +1,12 @@
 #domain/services/trend_analysis.py --> dilution check and pairing for ncav trend
+import math
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Tuple, List
 from domain.services.periods import _extract_period_date
-from domain.services.balance_sheet_metrics import safe_float
+from domain.services.period_accessors import get_shares_out as _shares_out
 
 def pct_change(old: Optional[float], new: Optional[float]) -> Optional[float]:
     """
@@ -15,6 +19,43 @@ def pct_change(old: Optional[float], new: Optional[float]) -> Optional[float]:
         return None
     return (float(new) - float(old)) / abs(float(old))
 
+# (approx_days, tolerance_days) for the qoq / hoh / yoy comparisons
+_QOQ_GAP = (90, 45)
+_HOH_GAP = (180, 60)
+_YOY_GAP = (365, 90)
+
+
+def _dated_gaps(
+    periods: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Dated periods (newest first) and each one's gap in days to the newest;
+    gaps[0] == 0 and the list is non-decreasing for sorted input.
+    """
+    dated = [(p, _extract_period_date(p)) for p in periods]
+    dated = [(p, d) for (p, d) in dated if d is not None]
+    if not dated:
+        return [], []
+    newer_dt = dated[0][1]
+    return [p for p, _ in dated], [(newer_dt - d).days for _, d in dated]
+
+
+def _pair_from_gaps(
+    dated: List[Dict[str, Any]],
+    gaps: List[int],
+    approx_days: int,
+    tolerance_days: int,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    if len(dated) < 2:
+        return None
+    # first older period whose gap is within approx_days ± tolerance_days
+    i = bisect_left(gaps, approx_days - tolerance_days, lo=1)
+    if i < len(gaps) and gaps[i] <= approx_days + tolerance_days:
+        return (dated[0], dated[i])
+    # fallback: just take first two if we didn't find a "nice" gap
+    return (dated[0], dated[1])
+
+
 def _pick_pair_by_gap(
     periods: List[Dict[str, Any]],
     approx_days: int,
@@ -27,69 +68,27 @@ def _pick_pair_by_gap(
     """
     if len(periods) < 2:
         return None
-
-    # Precompute dates
-    dated = [(p, _extract_period_date(p)) for p in periods]
-    dated = [(p, d) for (p, d) in dated if d is not None]
-    if len(dated) < 2:
-        return None
-
-    newer, newer_dt = dated[0]
-    # search older that matches gap
-    for older, older_dt in dated[1:]:
-        delta_days = (newer_dt - older_dt).days
-        if abs(delta_days - approx_days) <= tolerance_days:
-            return (newer, older)
-
-    # fallback: just take first two if we didn't find a "nice" gap
-    if len(dated) >= 2:
-        return (dated[0][0], dated[1][0])
-
-    return None
+    dated, gaps = _dated_gaps(periods)
+    return _pair_from_gaps(dated, gaps, approx_days, tolerance_days)
 
 def pair_for_qoq(periods: List[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
     # ~90 days gap +/- 45
-    return _pick_pair_by_gap(periods, approx_days=90, tolerance_days=45)
+    return _pick_pair_by_gap(periods, *_QOQ_GAP)
 
 def pair_for_hoh(periods: List[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
     # ~180 days gap +/- 60
-    return _pick_pair_by_gap(periods, approx_days=180, tolerance_days=60)
+    return _pick_pair_by_gap(periods, *_HOH_GAP)
 
 def pair_for_yoy(periods: List[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
     # ~365 days gap +/- 90
-    return _pick_pair_by_gap(periods, approx_days=365, tolerance_days=90)
-
-def _shares_out(period: Dict[str, Any]) -> Optional[float]:
-    """
-    Get shares_out from period snapshot.
-    We assume something like period["shares_out"] or inside balance/meta.
-    """
-    if period is None:
-        return None
-    # common places
-    for k in ["shares_out", "shares_outstanding", "basic_shares_out"]:
-        v = period.get(k)
-        if v is not None:
-            return safe_float(v)
-
-    # sometimes inside "meta" of the period
-    meta = period.get("meta") or {}
-    for k in ["shares_out", "shares_outstanding", "basic_shares_out"]:
-        v = meta.get(k)
-        if v is not None:
-            return safe_float(v)
+    return _pick_pair_by_gap(periods, *_YOY_GAP)
 
-    return None
-
-def _pct_change_shares(newer: Dict[str, Any], older: Dict[str, Any]) -> Optional[float]:
+def trend_pairs(periods: List[Dict[str, Any]]) -> tuple:
     """
-    (shares_new - shares_old) / shares_old
-    Positive => issued stock (dilution).
-    Negative => bought back.
+    (qoq, hoh, yoy) pairs in one go: period dates are read once and shared.
     """
-    sh_new = _shares_out(newer)
-    sh_old = _shares_out(older)
-    return pct_change(sh_old, sh_new)
+    dated, gaps = _dated_gaps(periods)
+    return tuple(_pair_from_gaps(dated, gaps, *gap) for gap in (_QOQ_GAP, _HOH_GAP, _YOY_GAP))
 
 @dataclass
 class DilutionWindowStats:
@@ -105,24 +104,95 @@ def _max_change_within_days(
     and record the worst issuance (max positive pct) and best buyback
     (most negative pct).
     """
-    dated = [(p, _extract_period_date(p)) for p in periods]
-    dated = [(p, d) for (p, d) in dated if d is not None]
-
+    # read each period once; pairs with missing shares never count
+    pts: List[Tuple[datetime, float]] = []
+    for p in periods:
+        d = _extract_period_date(p)
+        if d is None:
+            continue
+        sh = _shares_out(p)
+        if sh is not None:
+            pts.append((d, sh))
+
+    # the sliding window needs newest-first distinct dates and positive finite share counts
+    clean = all(pts[k][0] > pts[k + 1][0] for k in range(len(pts) - 1)) and all(
+        0 < sh < math.inf for _, sh in pts
+    )
+    if not clean:
+        return _max_change_pairwise(pts, window_days)
+    return _max_change_sliding(pts, window_days)
+
+
+def _max_change_sliding(
+    pts: List[Tuple[datetime, float]],
+    window_days: int,
+) -> DilutionWindowStats:
+    """
+    O(N) version for newest-first (date, shares>0) points: the older side of
+    every pair within the window is a sliding range, and for a fixed newer
+    point the extremes come from the smallest / largest older share count,
+    tracked with monotonic deques.
+    """
     max_issue: Optional[float] = None
     max_buyback: Optional[float] = None
+    lo: deque = deque()  # indices, shares increasing -> front is window min
+    hi: deque = deque()  # indices, shares decreasing -> front is window max
+    n = len(pts)
+    r = 0  # next older index to admit
+    limit = timedelta(days=window_days + 1)  # same as gap.days <= window_days
+
+    for i in range(n):
+        d_new, sh_new = pts[i]
+        while lo and lo[0] <= i:
+            lo.popleft()
+        while hi and hi[0] <= i:
+            hi.popleft()
+        r = max(r, i + 1)
+        while r < n and d_new - pts[r][0] < limit:
+            sh = pts[r][1]
+            while lo and pts[lo[-1]][1] >= sh:
+                lo.pop()
+            lo.append(r)
+            while hi and pts[hi[-1]][1] <= sh:
+                hi.pop()
+            hi.append(r)
+            r += 1
+        if not lo:
+            continue
+
+        issue = pct_change(pts[lo[0]][1], sh_new)
+        buyback = pct_change(pts[hi[0]][1], sh_new)
+        if max_issue is None or issue > max_issue:
+            max_issue = issue
+        if max_buyback is None or buyback < max_buyback:
+            max_buyback = buyback
 
-    for i in range(len(dated)):
-        p_new, d_new = dated[i]
-        for j in range(i + 1, len(dated)):
-            p_old, d_old = dated[j]
-            if d_new is None or d_old is None:
-                continue
-            gap = (d_new - d_old).days
-            if gap < 0:
+    return DilutionWindowStats(max_issue=max_issue, max_buyback=max_buyback)
+
+
+def _max_change_pairwise(
+    pts: List[Tuple[datetime, float]],
+    window_days: int,
+) -> DilutionWindowStats:
+    """
+    Reference O(N^2) scan over (date, shares) points in input order; used for
+    unsorted / duplicate-date / non-positive share inputs.
+    """
+    max_issue: Optional[float] = None
+    max_buyback: Optional[float] = None
+    limit = timedelta(days=window_days + 1)
+    zero = timedelta(0)
+
+    for i in range(len(pts)):
+        d_new, sh_new = pts[i]
+        for j in range(i + 1, len(pts)):
+            d_old, sh_old = pts[j]
+            gap = d_new - d_old
+            if gap < zero:
                 continue
-            if gap > window_days:
+            if gap >= limit:
                 continue
-            chg = _pct_change_shares(p_new, p_old)
+            chg = pct_change(sh_old, sh_new)
             if chg is None:
                 continue
             if max_issue is None or chg > max_issue:
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 import json
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional: faster parse of the cached rates file
+    import orjson
+except ImportError:
+    orjson = None
 
 from application.screening_service import FxProvider
 
+def _retrying_session() -> requests.Session:
+    # one pooled connection per process, with backoff on throttling / server errors
+    s = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    s.mount("https://", HTTPAdapter(max_retries=retry))
+    return s
+
+
 class ExchangerateHostFxProvider(FxProvider):
     """
     Fetch FX from exchangerate.host with base=USD and convert to
@@ -23,13 +39,23 @@ class ExchangerateHostFxProvider(FxProvider):
     """
 
     FX_URL = "https://api.exchangerate.host/latest?base=USD"
+    _session = _retrying_session()
 
     def __init__(self, cache_file: Path, ttl: timedelta | None = None) -> None:
         self._cache_file = cache_file
         self._ttl = ttl or timedelta(hours=24)
+        # normalized rates from the last call, keyed by the cache file mtime they came from
+        self._memo: Dict[str, float] | None = None
+        self._memo_mtime: float | None = None
 
     # ---------- Cache helpers ----------
 
+    def _cache_mtime(self) -> float:
+        try:
+            return self._cache_file.stat().st_mtime
+        except OSError:
+            return 0.0
+
     def _load_cache_raw(self) -> Dict[str, float] | None:
         if not self._cache_file.exists():
             return None
@@ -37,7 +63,8 @@ class ExchangerateHostFxProvider(FxProvider):
             st = datetime.fromtimestamp(self._cache_file.stat().st_mtime, tz=timezone.utc)
             if datetime.now(timezone.utc) - st > self._ttl:
                 return None
-            obj = json.loads(self._cache_file.read_text(encoding="utf-8"))
+            raw = self._cache_file.read_bytes()
+            obj = orjson.loads(raw) if orjson is not None else json.loads(raw)
             return obj.get("rates") or None
         except Exception:
             return None
@@ -53,7 +80,7 @@ class ExchangerateHostFxProvider(FxProvider):
     # ---------- Remote fetch ----------
 
     def _fetch_raw(self) -> Dict[str, float]:
-        r = requests.get(self.FX_URL, timeout=30)
+        r = self._session.get(self.FX_URL, timeout=30)
         r.raise_for_status()
         data = r.json()
         return data.get("rates") or {}
@@ -71,7 +98,7 @@ class ExchangerateHostFxProvider(FxProvider):
             if quoted in (None, 0):
                 continue
             try:
-                out[str(ccy).upper()] = 1.0 / float(quoted)
+                out[sys.intern(str(ccy).upper())] = 1.0 / float(quoted)
             except Exception:
                 continue
         out.setdefault("USD", 1.0)
@@ -80,6 +107,13 @@ class ExchangerateHostFxProvider(FxProvider):
     # ---------- Public API ----------
 
     def get_rates_ccy_to_usd(self) -> Dict[str, float]:
+        mtime = self._cache_mtime()
+        if self._memo is not None and mtime == self._memo_mtime:
+            # same file, but it still has to be within the TTL by the wall clock
+            age = datetime.now(timezone.utc) - datetime.fromtimestamp(mtime, tz=timezone.utc)
+            if age <= self._ttl:
+                return self._memo
+
         raw = self._load_cache_raw()
         if raw is None:
             try:
@@ -93,4 +127,6 @@ class ExchangerateHostFxProvider(FxProvider):
                     "HKD": 7.8,
                     "CNY": 7.2,
                 }
-        return self._normalize_ccy_to_usd(raw)
+        self._memo = self._normalize_ccy_to_usd(raw)
+        self._memo_mtime = self._cache_mtime()
+        return self._memo
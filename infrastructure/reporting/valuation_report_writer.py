@@ -1,17 +1,40 @@
 # infrastructure/reporting/valuation_report_writer.py
 
 from __future__ import annotations
+import csv
 import json
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Iterable, List, Dict
 
-import pandas as pd
-
-from domain.models.valuation_result import ValuationResult
+from domain.models.valuation_result import VALUATION_FIELDS, ValuationResult, ValuationTable
 from application.screening_service import ValuationWriter
 
+try:  # optional: much faster than stdlib json for the full report, and serializes dataclasses natively
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _csv_cells(row: Iterable[Any]) -> List[Any]:
+    # NaN -> empty cell, as DataFrame.to_csv wrote it
+    return ["" if v != v else v for v in row]
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Indented UTF-8 JSON; orjson when installed (NaN -> null), stdlib otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_csv(path: Path, table: ValuationTable) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(VALUATION_FIELDS)
+        w.writerows(_csv_cells(r) for r in zip(*(table.column(n) for n in VALUATION_FIELDS)))
+
 
 class CsvJsonValuationWriter(ValuationWriter):
     """
@@ -36,24 +59,28 @@ class CsvJsonValuationWriter(ValuationWriter):
         debug_json = self._internal_dir / f"flags_debug_{stamp}.json"
         latest_dbg = self._internal_dir / "latest_flags_debug.json"
 
-        # turn dataclasses into plain dicts
-        rows = [asdict(v) for v in valuations]
+        # one pass into columns; CSV rows stream straight from them
+        table = ValuationTable.from_results(valuations)
 
-        # CSV
-        df = pd.DataFrame(rows)
-        df.to_csv(latest_csv, index=False)
+        # file writes go to a small pool so the JSON serialization below overlaps the IO
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            pending = [ex.submit(_write_csv, latest_csv, table)]
 
-        # JSON export of full rows
-        latest_json.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+            # JSON export of full rows (orjson takes the dataclasses directly; stdlib needs dicts)
+            rows_bytes = _dump_json(valuations if orjson is not None else table.to_records())
+            pending.append(ex.submit(latest_json.write_bytes, rows_bytes))
 
-        # debug payload (fx subset + metadata)
-        debug_payload = {
-            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-            "rows_count": len(rows),
-            "fx_rates_ccy_to_usd": fx_rates_ccy_to_usd,
-        }
-        debug_json.write_text(json.dumps(debug_payload, indent=2), encoding="utf-8")
-        latest_dbg.write_text(json.dumps(debug_payload, indent=2), encoding="utf-8")
+            # debug payload (fx subset + metadata): serialized once, same bytes to both files
+            debug_payload = {
+                "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "rows_count": len(table),
+                "fx_rates_ccy_to_usd": fx_rates_ccy_to_usd,
+            }
+            debug_bytes = _dump_json(debug_payload)
+            pending += [ex.submit(p.write_bytes, debug_bytes) for p in (debug_json, latest_dbg)]
+
+            for fut in pending:
+                fut.result()
 
         return {
             "csv": str(latest_csv),
@@ -0,0 +1,81 @@
+# infrastructure/repositories/arrow_csv.py
+"""
+DataFrame -> CSV, byte-for-byte what DataFrame.to_csv(index=False) writes.
+
+Arrow's writer formats some types its own way (true/false, 1 instead of 1.0,
+quoted strings, datetimes with microseconds), so columns are first turned into
+the text pandas would write; Arrow then only joins the cells. Anything that is
+not plainly str / int / float / bool / category, and any cell that would need
+quoting, goes through pandas instead.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+try:  # optional: Arrow's C++ CSV writer instead of per-cell Python formatting
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+
+def _as_text(s: pd.Series) -> Optional[pd.Series]:
+    """s as pandas' CSV text (missing -> None), or None when Arrow cannot match pandas for it."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        s = s.astype(object)
+    dt = s.dtype
+    if isinstance(dt, pd.StringDtype):
+        return s.astype(object).where(s.notna(), None)
+    if dt == object:
+        # str / missing only; anything else keeps the pandas path
+        if not all(isinstance(v, str) for v in s.dropna().to_numpy()):
+            return None
+        return s.where(s.notna(), None)
+    if dt == bool:
+        return pd.Series(np.where(s.to_numpy(), "True", "False"), dtype=object)
+    if not isinstance(dt, np.dtype):
+        return None  # nullable / datetime-tz / other extension types
+    if dt.kind in "iu":
+        return pd.Series(s.to_numpy().astype(str), dtype=object)
+    if dt == np.float64:
+        v = s.to_numpy()
+        txt = v.astype(str).astype(object)  # shortest repr, as pandas writes floats
+        txt[np.isnan(v)] = None
+        return pd.Series(txt, dtype=object)
+    return None
+
+
+_NEEDS_QUOTES = (",", '"', "\n", "\r")
+
+
+def _to_table(df: pd.DataFrame):
+    names = list(df.columns)
+    if len(names) < 2 or not all(isinstance(c, str) and c and not any(q in c for q in _NEEDS_QUOTES) for c in names):
+        return None  # a lone empty cell / odd headers are quoted by pandas
+    cols = {}
+    for name in names:
+        txt = _as_text(df[name])
+        if txt is None:
+            return None
+        cols[name] = pa.array(txt.to_numpy(), type=pa.string(), from_pandas=True)
+    return pa.table(cols)
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """df -> CSV without the index; Arrow when installed, pandas otherwise (same bytes either way)."""
+    if pacsv is not None and df.columns.is_unique:
+        try:
+            table = _to_table(df)
+            if table is not None:
+                with open(path, "wb") as f:
+                    # Arrow always quotes its header row; pandas does not
+                    f.write((",".join(table.column_names) + "\n").encode("utf-8"))
+                    # quoting "none" refuses cells with , " or newlines; pandas quotes those
+                    pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+                return
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+    df.to_csv(path, index=False)
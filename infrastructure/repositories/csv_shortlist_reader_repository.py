@@ -3,8 +3,15 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import List
+import numpy as np
 import pandas as pd
 
+try:  # optional: Arrow's multithreaded CSV parser
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
 from application.screening_service import ShortlistRepository, ShortlistItem
 
 
@@ -21,20 +28,20 @@ class CsvShortlistReaderRepository(ShortlistRepository):
         self._price_column = price_column
 
     def load_shortlist(self, path: Path) -> List[ShortlistItem]:
-        df = pd.read_csv(path)
-
-        if "ticker" not in df.columns:
+        header = pd.read_csv(path, nrows=0).columns
+        if "ticker" not in header:
             raise ValueError("shortlist CSV is missing required column 'ticker'")
-        if self._price_column not in df.columns:
+        if self._price_column not in header:
             raise ValueError(f"shortlist CSV is missing required column '{self._price_column}'")
 
-        df[self._price_column] = pd.to_numeric(df[self._price_column], errors="coerce")
+        # ncav_all-style files carry ~20 columns; parse only the two we use
+        df = pd.read_csv(path, usecols=["ticker", self._price_column], engine=_CSV_ENGINE)
+
+        prices = pd.to_numeric(df[self._price_column], errors="coerce").to_numpy(dtype="float64")
+        keep = ~np.isnan(prices)
+        tickers = df["ticker"].to_numpy()[keep]
 
-        items: List[ShortlistItem] = []
-        for _, row in df.iterrows():
-            ticker = str(row["ticker"]).upper().strip()
-            price = row[self._price_column]
-            if pd.isna(price):
-                continue
-            items.append(ShortlistItem(ticker=ticker, last_price=float(price)))
-        return items
+        return [
+            ShortlistItem(ticker=str(t).upper().strip(), last_price=float(p))
+            for t, p in zip(tickers, prices[keep])
+        ]
@@ -1,20 +1,41 @@
 #infrastructure/repositories/csv_shortlist_repository.py
 from pathlib import Path
+from typing import NamedTuple
 import pandas as pd
 
+try:  # optional: Arrow's multithreaded CSV parser
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
+
+class ShortlistRow(NamedTuple):
+    ticker: str
+    y_symbol: str
+
+
 class CsvShortlistRepo:
     """Tiny helper if you need to inspect shortlist composition in other commands."""
     def __init__(self, csv_path: Path):
         self.csv_path = csv_path
 
-    def rows(self) -> list[dict]:
-        df = pd.read_csv(self.csv_path)
+    def rows(self) -> list[ShortlistRow]:
+        header = pd.read_csv(self.csv_path, nrows=0).columns
         # allow flexible column names for yahoo symbol
         ycols = ["y_symbol","y_ticker","yahoo","yf_symbol","YahooSymbol","Y_symbol"]
-        ycol = next((c for c in ycols if c in df.columns), None)
+        ycol = next((c for c in ycols if c in header), None)
+        use = [c for c in header if c in ("ticker", "symbol", ycol)]
+        df = pd.read_csv(self.csv_path, usecols=use, engine=_CSV_ENGINE)
+        n = len(df)
+
+        def col(name):
+            return df[name].to_numpy() if name and name in df.columns else [None] * n
+
+        # column arrays instead of iterrows(); same truthiness rules per cell
         out = []
-        for _, r in df.iterrows():
-            t = str(r.get("ticker") or r.get("symbol") or "").upper().strip()
+        for tk, sym, y in zip(col("ticker"), col("symbol"), col(ycol)):
+            t = str(tk or sym or "").upper().strip()
             if not t: continue
-            out.append({"ticker": t, "y_symbol": (str(r.get(ycol)).strip() if ycol and r.get(ycol) else "")})
+            out.append(ShortlistRow(t, str(y).strip() if y else ""))
         return out
@@ -4,6 +4,12 @@ from pathlib import Path
 from typing import List, Dict
 import pandas as pd
 
+try:  # optional: Arrow's multithreaded CSV parser
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
 from application.ports import ShortlistUniverseRepository
 
 
@@ -19,9 +25,10 @@ class CsvUniverseLoaderRepository(ShortlistUniverseRepository):
             raise FileNotFoundError(f"Universe CSV not found: {self.csv_path}")
 
     def load_tickers(self) -> List[Dict[str, str]]:
-        df = pd.read_csv(self.csv_path)
-        if "ticker" not in df.columns:
+        header = pd.read_csv(self.csv_path, nrows=0).columns
+        if "ticker" not in header:
             raise ValueError(f"{self.csv_path} must have a 'ticker' column")
 
-        keep = [c for c in ["ticker", "name", "country", "mic"] if c in df.columns]
+        keep = [c for c in ["ticker", "name", "country", "mic"] if c in header]
+        df = pd.read_csv(self.csv_path, usecols=keep, engine=_CSV_ENGINE)
         return df[keep].to_dict(orient="records")
@@ -6,6 +6,7 @@ from pathlib import Path
 import json
 import pandas as pd
 from application.ports import UniverseRepository
+from infrastructure.repositories.arrow_csv import write_csv
 
 class CsvUniverseWriterRepository(UniverseRepository):
     """
@@ -19,7 +20,7 @@ class CsvUniverseWriterRepository(UniverseRepository):
         self.tickers_dir.mkdir(parents=True, exist_ok=True)
 
     def _write_pair(self, csv_path: Path, meta_path: Path, df: pd.DataFrame, meta: Dict[str, Any]) -> None:
-        df.to_csv(csv_path, index=False)
+        write_csv(df, csv_path)
         meta_out = dict(meta)
         meta_out["path"] = str(csv_path)
         meta_path.write_text(json.dumps(meta_out, indent=2), encoding="utf-8")
@@ -0,0 +1,175 @@
+# infrastructure/repositories/json_pack.py
+"""
+Single-file pack of a directory of small per-ticker JSON files.
+
+The pack is an Arrow IPC file with one row per source file (name, raw bytes),
+opened memory-mapped: one open + mmap instead of an open/read/close per ticker.
+Payloads are stored verbatim, so readers parse exactly what the JSON file held.
+
+Opt in by building a pack once; FetchCacheOrchestrator refreshes existing
+packs at the end of run_all. A pack older than any loose *.json in its
+directory is ignored, so a tool run on its own never gets shadowed. Standalone:
+
+    python -m infrastructure.repositories.json_pack cache/sec_core cache/sec_insider
+"""
+from __future__ import annotations
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:  # optional: several times faster than stdlib json on the per-ticker blobs
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: without pyarrow there is no pack and the per-file JSON is used
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+PACK_NAME = "_pack.arrow"
+
+_log = logging.getLogger("json_pack")
+
+
+def build_pack(src_dir: Path) -> Path:
+    """Pack every *.json in src_dir into src_dir/PACK_NAME (atomic replace)."""
+    if pa is None:
+        raise ImportError("pyarrow is required to build a JSON pack")
+    src_dir = Path(src_dir)
+    files = sorted(p for p in src_dir.glob("*.json") if p.is_file())
+    table = pa.table({
+        "name": pa.array([p.name for p in files], type=pa.string()),
+        "payload": pa.array([p.read_bytes() for p in files], type=pa.large_binary()),
+    })
+    out = src_dir / PACK_NAME
+    tmp = out.with_suffix(f".{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, out)  # readers never map a half-written pack
+    return out
+
+
+class JsonPack:
+    """Read side of a pack: file name -> raw bytes."""
+
+    def __init__(self, table) -> None:
+        self._payload = table.column("payload")
+        self._index: Dict[str, int] = {n: i for i, n in enumerate(table.column("name").to_pylist())}
+
+    @classmethod
+    def open(cls, directory: Path) -> Optional["JsonPack"]:
+        """The directory's pack, or None when there is none (or pyarrow is missing / it is unreadable)."""
+        path = Path(directory) / PACK_NAME
+        if pa is None or not path.is_file():
+            return None
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            return cls(table)
+        except Exception:
+            return None
+
+    @property
+    def names(self) -> frozenset:
+        return frozenset(self._index)
+
+    def get(self, name: str) -> Optional[bytes]:
+        i = self._index.get(name)
+        if i is None:
+            return None
+        return self._payload[i].as_py()
+
+
+def _read_file(path: Path) -> Optional[bytes]:
+    # plain fd read: skips the buffered file object for these small one-shot reads
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            raw = os.read(fd, size)
+            while len(raw) < size:
+                chunk = os.read(fd, size - len(raw))
+                if not chunk:
+                    break
+                raw += chunk
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    return raw
+
+
+class JsonDir:
+    """
+    A directory of per-ticker JSON files, served from its pack when that is current.
+    The listing (and pack) is taken on first lookup; call invalidate() after rewrites.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._dir = Path(directory)
+        self._files: Optional[frozenset] = None
+        self._pack: Optional[JsonPack] = None
+
+    def names(self) -> frozenset:
+        # one scandir instead of an exists() stat per candidate file
+        if self._files is None:
+            listing, entries = set(), []
+            try:
+                with os.scandir(self._dir) as it:
+                    for e in it:
+                        listing.add(e.name)
+                        entries.append(e)
+            except OSError:
+                pass
+            self._pack = None
+            if PACK_NAME in listing:  # packs are opt-in: without one, no per-file stat at all
+                if self._pack_is_current(entries):
+                    self._pack = JsonPack.open(self._dir)
+                else:
+                    _log.warning("%s is older than the JSON files next to it; ignoring it", self._dir / PACK_NAME)
+            self._files = frozenset(listing) | self._pack.names if self._pack is not None else frozenset(listing)
+        return self._files
+
+    def _pack_is_current(self, entries: List[os.DirEntry]) -> bool:
+        # stops at the first *.json newer than the pack
+        try:
+            pack_mtime = (self._dir / PACK_NAME).stat().st_mtime
+            return not any(e.name.endswith(".json") and e.stat().st_mtime > pack_mtime for e in entries)
+        except OSError:
+            return False
+
+    def invalidate(self) -> None:
+        """Forget the cached listing and pack, e.g. after new files were written."""
+        self._files = None
+        self._pack = None
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        # the pack (one mmap) serves anything it holds; the loose file covers the rest
+        if self._pack is not None:
+            raw = self._pack.get(name)
+            if raw is not None:
+                return raw
+        return _read_file(self._dir / name)
+
+    def read_json(self, name: str) -> Optional[Dict[str, Any]]:
+        raw = self.read_bytes(name)
+        if raw is None:
+            return None
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except Exception:
+                pass  # e.g. NaN literals written by json.dumps; let stdlib json decide
+        try:
+            return json.loads(raw)
+        except Exception:
+            return None
+
+
+if __name__ == "__main__":
+    for d in sys.argv[1:]:
+        print("[PACK]", build_pack(Path(d)))
@@ -5,21 +5,29 @@ from pathlib import Path
 import json
 from typing import Any
 
+from infrastructure.repositories.arrow_csv import write_csv
+
 class LocalShortlistRepository:
     def __init__(self, root: Path) -> None:
         self.root = Path(root)
         self.data_dir = self.root / "data" / "tickers"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.out_all = self.data_dir / "ncav_all.csv"
+        self.out_all_parquet = self.data_dir / "ncav_all.parquet"
         self.out_short = self.data_dir / "ncav_shortlist.csv"
         self.out_meta = self.data_dir / "ncav_shortlist.meta.json"
 
     def save_all(self, df):
-        df.to_csv(self.out_all, index=False)
+        write_csv(df, self.out_all)
         return self.out_all
 
+    def save_all_parquet(self, df):
+        # columnar + zstd: no per-value float formatting, much smaller on disk (needs pyarrow)
+        df.to_parquet(self.out_all_parquet, engine="pyarrow", compression="zstd", index=False)
+        return self.out_all_parquet
+
     def save_shortlist(self, df):
-        df.to_csv(self.out_short, index=False)
+        write_csv(df, self.out_short)
         return self.out_short
 
     def save_meta(self, payload: Any):
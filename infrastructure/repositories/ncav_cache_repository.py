@@ -10,9 +10,10 @@ from tools.ncav_cache import build_or_update, load_cached  # type: ignore
 _log = logging.getLogger("shortlist.fundamentals")
 
 class NcavCacheRepository(FundamentalsRepository):
-    def get_or_update(self, house_ticker: str, fetch_timeout: int) -> Dict[str, Any]:
+    def get_or_update(self, house_ticker: str, fetch_timeout: int,
+                      max_age_hours: Optional[float] = None) -> Dict[str, Any]:
         _log.debug("fetching fundamentals (update) for %s", house_ticker)
-        rec = build_or_update(house_ticker, fetch_timeout)
+        rec = build_or_update(house_ticker, fetch_timeout, min_refresh_hours=max_age_hours)
         d = rec.__dict__.copy()
         out = {
             "ticker": d.get("ticker"),
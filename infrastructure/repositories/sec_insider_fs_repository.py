@@ -1,24 +1,23 @@
 #infrastructure/repositories/sec_insider_fs_repository.py
 from __future__ import annotations
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from infrastructure.repositories.json_pack import JsonDir
 from application.screening_service import InsiderRepository
 
 
 class SecInsiderFsRepository(InsiderRepository):
     def __init__(self, insider_dir: Path) -> None:
         self._insider_dir = insider_dir
+        self._files = JsonDir(insider_dir)
 
-    def _read_json(self, path: Path) -> Optional[Dict[str, Any]]:
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
+    def invalidate(self) -> None:
+        """Forget the cached listing, e.g. after a new insider scan."""
+        self._files.invalidate()
 
     def load_insiders(self, ticker: str) -> Optional[Dict[str, Any]]:
-        p = self._insider_dir / f"{ticker}.json"
-        if not p.exists():
+        name = f"{ticker}.json"
+        if name not in self._files.names():
             return None
-        return self._read_json(p)
+        return self._files.read_json(name)
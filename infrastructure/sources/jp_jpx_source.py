@@ -1,28 +1,46 @@
 # infrastructure/sources/jp_jpx_source.py
 from __future__ import annotations
 from pathlib import Path
+from types import ModuleType
+from typing import Dict
 import importlib.util
+import threading
 import pandas as pd
 
 from application.ports import TickerSource
 from infrastructure.config.paths import RepoPaths
+from infrastructure.sources.tool_output import todays_output
+
+# tool modules are loaded (compiled + top level run) once per process, keyed by file
+_TOOL_CACHE: Dict[Path, ModuleType] = {}
+_TOOL_LOCK = threading.Lock()
 
 class JPJpxSource(TickerSource):
     market_code = "JP"
     source_label = "JPX primary list"
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(self, project_root: Path, force_refresh: bool = False) -> None:
         self.paths = RepoPaths.from_root(Path(project_root))
+        self.force_refresh = force_refresh
 
     def _import_tool(self):
         tool_path = self.paths.tools / "build_universe" / "jp_jpx.py"
-        spec = importlib.util.spec_from_file_location("jp_jpx_tool", tool_path)
-        if spec is None or spec.loader is None:
-            raise FileNotFoundError(f"Missing {tool_path}")
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+        with _TOOL_LOCK:
+            mod = _TOOL_CACHE.get(tool_path)
+            if mod is None:
+                spec = importlib.util.spec_from_file_location("jp_jpx_tool", tool_path)
+                if spec is None or spec.loader is None:
+                    raise FileNotFoundError(f"Missing {tool_path}")
+                mod = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+                _TOOL_CACHE[tool_path] = mod
         return mod
 
     def fetch(self) -> pd.DataFrame:
         mod = self._import_tool()
+        # listings change at most daily: reuse today's output instead of re-crawling
+        if not self.force_refresh:
+            cached = todays_output(mod.OUT, mod.OUT_META)
+            if cached is not None:
+                return cached
         return mod.fetch_list()
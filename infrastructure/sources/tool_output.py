@@ -0,0 +1,26 @@
+# infrastructure/sources/tool_output.py
+from __future__ import annotations
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+
+
+def todays_output(out_csv: Path, out_meta: Path) -> Optional[pd.DataFrame]:
+    """
+    The listing a build_universe tool already wrote today (UTC), or None.
+    The tool writes its meta file right after the CSV, so the meta mtime dates the pair.
+    Empty listings don't count: those are fallbacks worth retrying.
+    """
+    try:
+        mtime = out_meta.stat().st_mtime
+    except OSError:
+        return None
+    if datetime.fromtimestamp(mtime, timezone.utc).date() != datetime.now(timezone.utc).date():
+        return None
+    try:
+        # codes stay text ("0005" must not become 5); only blank cells are missing
+        df = pd.read_csv(out_csv, dtype=str, keep_default_na=False, na_values=[""])
+    except (OSError, ValueError):
+        return None
+    return None if df.empty else df
@@ -1,16 +1,65 @@
 ## infrastructure/sources/yahoo_fx_provider.py
 
 from __future__ import annotations
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Optional
+import hashlib, json, os
 import pandas as pd
 import yfinance as yf
 
+try:  # optional: faster parse of the cached rates file
+    import orjson
+except ImportError:
+    orjson = None
+
 from application.ports import FxProvider
 
 
 class YahooFxProvider(FxProvider):
     FX_BASE = "USD"
 
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        # daily closes change at most once a day: one file per (currency set, UTC date)
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    def _cache_path(self, currencies: List[str]) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        codes = ",".join(sorted({(c or "USD").upper() for c in currencies}))
+        today = datetime.now(timezone.utc).date().isoformat()
+        key = hashlib.md5(f"{codes}|{today}".encode("utf-8")).hexdigest()
+        return self._cache_dir / f"fx_{today}_{key}.json"
+
+    @staticmethod
+    def _read_cache(path: Path) -> Optional[Dict[str, float]]:
+        try:
+            raw = path.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _write_cache(path: Path, rates: Dict[str, float]) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(rates, indent=2), encoding="utf-8")
+            os.replace(tmp, path)  # readers never see a half-written file
+        except Exception:
+            pass
+
+    @staticmethod
+    def _prune_cache(path: Path) -> None:
+        """Delete cached answers from earlier UTC days (fx_<date>_<key>.json)."""
+        today = path.name.split("_")[1]
+        for old in path.parent.glob("fx_*_*.json"):
+            if old.name.split("_")[1] < today:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+
     @staticmethod
     def _pairs(codes: List[str]) -> List[str]:
         out = []
@@ -20,6 +69,21 @@ class YahooFxProvider(FxProvider):
         return out
 
     def usd_per_ccy(self, currencies: List[str]) -> Dict[str, float]:
+        cache = self._cache_path(currencies)
+        if cache is not None and cache.exists():
+            cached = self._read_cache(cache)
+            if cached:
+                return cached
+
+        out = self._download(currencies)
+        # only keep a complete answer: a partial download is retried on the next call
+        wanted = {(c or "USD").upper() for c in currencies}
+        if cache is not None and all(pd.notna(out.get(c)) for c in wanted):
+            self._write_cache(cache, out)
+            self._prune_cache(cache)
+        return out
+
+    def _download(self, currencies: List[str]) -> Dict[str, float]:
         pairs = self._pairs(currencies)
         out: Dict[str, float] = {"USD": 1.0}
         try:
@@ -30,8 +94,9 @@ class YahooFxProvider(FxProvider):
         def last_close(d: pd.DataFrame) -> Optional[float]:
             if d is None or d.empty or "Close" not in d.columns:
                 return None
-            d = d.sort_index()
-            return float(d.iloc[-1]["Close"])
+            if not d.index.is_monotonic_increasing:  # yfinance already returns dates ascending
+                d = d.sort_index()
+            return float(d["Close"].to_numpy()[-1])
 
         if isinstance(df, pd.DataFrame) and isinstance(df.columns, pd.MultiIndex):
             for p in pairs:
@@ -1,9 +1,12 @@
 ## infrastructure/sources/yahoo_price_client.py
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from typing import Dict, List, Optional, Tuple
-import os, random, time
+import os, random, threading, time
 import pandas as pd
+import requests
 import yfinance as yf
 
 from application.ports import PriceClient
@@ -11,55 +14,146 @@ from application.ports import PriceClient
 
 PRICE_RPS = float(os.environ.get("YF_PRICE_RPS", "0.8"))
 SLEEP_BASE = 1.0 / max(0.1, PRICE_RPS)
+# chunks in flight at once; the shared limiter below still caps requests at PRICE_RPS
+PRICE_WORKERS = max(1, int(os.environ.get("YF_PRICE_WORKERS", "8")))
 
 
-def _sleep_between_batches():
-    time.sleep(SLEEP_BASE * (1.0 + random.uniform(-0.15, 0.15)))
+# spark returns closes only, many symbols per request (Yahoo caps it at ~20)
+SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+SPARK_MAX_SYMBOLS = 20
+YF_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+class _RateLimiter:
+    """Hands out jittered request slots SLEEP_BASE apart, shared by every thread in the process."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval * (1.0 + random.uniform(-0.15, 0.15))
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_LIMITER = _RateLimiter(SLEEP_BASE)
+
+
+def _spark_series(item: dict) -> Tuple[List[int], List[Optional[float]], int]:
+    """(timestamps, closes, gmtoffset) from one spark result entry."""
+    resp = (item.get("response") or [{}])[0]
+    quote = ((resp.get("indicators") or {}).get("quote") or [{}])[0]
+    gmtoffset = (resp.get("meta") or {}).get("gmtoffset") or 0
+    return resp.get("timestamp") or [], quote.get("close") or [], int(gmtoffset)
+
+
+def _spark_last_close(item: dict, today: date) -> Tuple[Optional[float], Optional[str]]:
+    # same rule as the yfinance path: skip today's (possibly unfinished) bar when there is an earlier one
+    ts, closes, gmtoffset = _spark_series(item)
+    bars = [(t, c) for t, c in zip(ts, closes) if t is not None and c is not None]
+    if not bars:
+        return (None, None)
+    days = [datetime.fromtimestamp(t + gmtoffset, tz=timezone.utc).date() for t, _ in bars]
+    k = len(bars) - 1
+    if days[k] >= today and len(bars) >= 2:
+        k -= 1
+    return (float(bars[k][1]), days[k].isoformat())
 
 
 class YahooPriceClient(PriceClient):
     def latest_closes(self, y_symbols: List[str], batch_size: int) -> Dict[str, Tuple[Optional[float], Optional[str]]]:
         out: Dict[str, Tuple[Optional[float], Optional[str]]] = {s: (None, None) for s in y_symbols}
+
+        # batching
+        def chunks(seq, n):
+            return [seq[i:i+n] for i in range(0, len(seq), n)]
+
+        # one compact spark request per <=20 symbols; anything it can't price goes to yf.download
+        today = pd.Timestamp.today().normalize().date()
+        spark_chunks = chunks(list(y_symbols), min(batch_size, SPARK_MAX_SYMBOLS))
+        if spark_chunks:
+            first = self._spark(spark_chunks[0])
+            # an empty first answer means the endpoint is down or blocked: leave everything to yfinance
+            results = [first] + self._map(self._spark, spark_chunks[1:]) if first else []
+            for items in results:
+                for s, item in items.items():
+                    if s in out:
+                        try:
+                            out[s] = _spark_last_close(item, today)
+                        except Exception:
+                            pass
+
+        missing = [s for s in y_symbols if out[s][0] is None]
+        for res in self._map(self._download_closes, chunks(missing, batch_size)):
+            out.update(res)
+        return out
+
+    @staticmethod
+    def _map(fn, items: list) -> list:
+        if len(items) <= 1:
+            return [fn(x) for x in items]
+        with ThreadPoolExecutor(max_workers=min(PRICE_WORKERS, len(items))) as ex:
+            return list(ex.map(fn, items))
+
+    def _spark(self, symbols: List[str]) -> Dict[str, dict]:
+        """symbol -> spark result entry; empty on repeated failure."""
+        params = {"symbols": ",".join(symbols), "range": "7d", "interval": "1d"}
+        for attempt in range(4):
+            _LIMITER.wait()
+            try:
+                r = requests.get(SPARK_URL, params=params, headers=YF_HEADERS, timeout=20)
+                r.raise_for_status()
+                results = ((r.json() or {}).get("spark") or {}).get("result") or []
+                return {item.get("symbol"): item for item in results if item.get("symbol")}
+            except Exception:
+                if attempt == 3:
+                    return {}
+                time.sleep(min(6.0, (0.8 * (2 ** attempt)) * (1.0 + random.uniform(-0.2, 0.2))))
+        return {}
+
+    def _download_closes(self, chunk: List[str]) -> Dict[str, Tuple[Optional[float], Optional[str]]]:
+        """yf.download fallback for one chunk; symbols it can't price are left out."""
         def last_close(d: pd.DataFrame):
             if d is None or d.empty or "Close" not in d.columns:
                 return (None, None)
-            d = d.sort_index()
+            if not d.index.is_monotonic_increasing:  # yfinance already returns dates ascending
+                d = d.sort_index()
+            # plain array access: no per-row Series built by iloc
+            closes = d["Close"].to_numpy()
             today = pd.Timestamp(pd.Timestamp.today().normalize())
-            idx = d.index[-1]
-            if isinstance(idx, pd.Timestamp) and idx.normalize() >= today and len(d) >= 2:
-                row = d.iloc[-2]
-                return (float(row["Close"]), d.index[-2].date().isoformat())
-            row = d.iloc[-1]
-            date = row.name.date().isoformat() if isinstance(row.name, pd.Timestamp) else None
-            return (float(row["Close"]), date)
-
-        # batching
-        def chunks(seq, n):
-            for i in range(0, len(seq), n):
-                yield seq[i:i+n]
+            last = d.index[-1]
+            if isinstance(last, pd.Timestamp) and last.normalize() >= today and len(closes) >= 2:
+                return (float(closes[-2]), d.index[-2].date().isoformat())
+            date = last.date().isoformat() if isinstance(last, pd.Timestamp) else None
+            return (float(closes[-1]), date)
 
-        for chunk in chunks(list(y_symbols), batch_size):
-            df = None
-            for attempt in range(4):
-                try:
-                    df = yf.download(
-                        chunk, period="7d", interval="1d",
-                        auto_adjust=False, group_by="ticker",
-                        progress=False, threads=True,
-                    )
+        out: Dict[str, Tuple[Optional[float], Optional[str]]] = {}
+        df = None
+        for attempt in range(4):
+            _LIMITER.wait()
+            try:
+                df = yf.download(
+                    chunk, period="7d", interval="1d",
+                    auto_adjust=False, group_by="ticker",
+                    progress=False, threads=True,
+                )
+                break
+            except Exception:
+                if attempt == 3:
+                    df = None
                     break
+                time.sleep(min(6.0, (0.8 * (2 ** attempt)) * (1.0 + random.uniform(-0.2, 0.2))))
+        if isinstance(df, pd.DataFrame) and isinstance(df.columns, pd.MultiIndex):
+            for s in chunk:
+                try:
+                    out[s] = last_close(df[s])
                 except Exception:
-                    if attempt == 3:
-                        df = None
-                        break
-                    time.sleep(min(6.0, (0.8 * (2 ** attempt)) * (1.0 + random.uniform(-0.2, 0.2))))
-            if isinstance(df, pd.DataFrame) and isinstance(df.columns, pd.MultiIndex):
-                for s in chunk:
-                    try:
-                        out[s] = last_close(df[s])
-                    except Exception:
-                        pass
-            elif isinstance(df, pd.DataFrame) and len(chunk) == 1:
-                out[chunk[0]] = last_close(df)
-            _sleep_between_batches()
+                    pass
+        elif isinstance(df, pd.DataFrame) and len(chunk) == 1:
+            out[chunk[0]] = last_close(df)
         return out
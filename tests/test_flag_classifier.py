@@ -0,0 +1,34 @@
+# tests/test_flag_classifier.py
+import math
+import random
+
+import numpy as np
+
+from domain.services.flag_classifier import classify_flags, classify_flags_batch
+
+_KEYS = ("p_to_ncav", "cr", "de", "ncav_qoq", "ncav_hoh", "ncav_yoy", "dil_qoq", "dil_hoh",
+         "dil_yoy", "max_dil_1y", "max_issue_3y", "max_buyback_3y")
+# values straddling every rule threshold, plus missing
+_VALUES = (None, -0.5, -0.2, -0.05, 0.0, 0.05, 0.08, 0.2, 2.0 / 3.0, 1.5, 2.0, 3.0, math.nan)
+
+
+def test_batch_matches_single_row_classification():
+    rng = random.Random(5)
+    rows = [{k: rng.choice(_VALUES) for k in _KEYS} for _ in range(2000)]
+    outdated = [rng.random() < 0.3 for _ in rows]
+
+    metrics = {k: np.array([np.nan if r[k] is None else r[k] for r in rows], dtype="float64") for k in _KEYS}
+    metrics["is_outdated"] = np.array(outdated, dtype=bool)
+    green, red = classify_flags_batch(metrics)
+
+    for i, r in enumerate(rows):
+        # the batch path treats NaN as missing, so the single-row reference gets None for it
+        single = {k: (None if v is None or v != v else v) for k, v in r.items()}
+        want = classify_flags(
+            single["p_to_ncav"], single["cr"], single["de"],
+            single["ncav_qoq"], single["ncav_hoh"], single["ncav_yoy"],
+            single["dil_qoq"], single["dil_hoh"], single["dil_yoy"],
+            single["max_dil_1y"], single["max_issue_3y"], single["max_buyback_3y"],
+            outdated[i],
+        )
+        assert (green[i], red[i]) == want
@@ -0,0 +1,57 @@
+# tests/test_json_pack.py
+import os
+import time
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from infrastructure.repositories.json_pack import PACK_NAME, JsonDir, JsonPack, build_pack
+from infrastructure.repositories.sec_core_fs_repository import SecCoreFsRepository
+from infrastructure.repositories.sec_insider_fs_repository import SecInsiderFsRepository
+
+
+def _write(path, text, mtime):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_pack_round_trip(tmp_path):
+    t0 = time.time() - 100
+    _write(tmp_path / "AAA.US_core.json", '{"meta": {"ticker": "AAA.US"}}', t0)
+    _write(tmp_path / "BBB.US.json", '{"x": NaN}', t0)
+    build_pack(tmp_path)
+
+    pack = JsonPack.open(tmp_path)
+    assert pack.names == {"AAA.US_core.json", "BBB.US.json"}
+    assert pack.get("AAA.US_core.json") == (tmp_path / "AAA.US_core.json").read_bytes()
+    assert pack.get("missing.json") is None
+
+    # the repositories serve the same content from the pack once the loose files are gone
+    for p in tmp_path.glob("*.json"):
+        p.unlink()
+    repo = SecCoreFsRepository(tmp_path)
+    assert repo.load_core("AAA.US") == {"meta": {"ticker": "AAA.US"}}
+    assert repo.load_core("ZZZ.US") is None
+    nan = SecInsiderFsRepository(tmp_path).load_insiders("BBB.US")["x"]
+    assert nan != nan
+
+
+def test_stale_pack_is_ignored(tmp_path):
+    t0 = time.time() - 100
+    _write(tmp_path / "AAA.US.json", '{"v": 1}', t0)
+    build_pack(tmp_path)
+    os.utime(tmp_path / PACK_NAME, (t0 + 1, t0 + 1))
+
+    # a tool rewrites one ticker after the pack was built
+    _write(tmp_path / "AAA.US.json", '{"v": 2}', t0 + 50)
+    assert SecInsiderFsRepository(tmp_path).load_insiders("AAA.US") == {"v": 2}
+
+
+def test_current_pack_is_used(tmp_path):
+    t0 = time.time() - 100
+    _write(tmp_path / "AAA.US.json", '{"v": 1}', t0)
+    build_pack(tmp_path)
+    d = JsonDir(tmp_path)
+    assert "AAA.US.json" in d.names()
+    assert d._pack is not None
@@ -0,0 +1,51 @@
+# tests/test_periods.py
+import random
+from datetime import datetime, timedelta
+
+from domain.services.periods import _extract_period_date, all_periods_sorted
+
+_BASE = datetime(2025, 12, 31)
+
+
+def _reference_all_periods_sorted(core):
+    # the original dict-based dedupe: quarterly first, first snapshot per day wins, then re-sort
+    def newest_first(ps):
+        dated = [(p, _extract_period_date(p)) for p in ps]
+        dated = [(p, d) for p, d in dated if d is not None]
+        dated.sort(key=lambda t: t[1], reverse=True)
+        return [p for p, _ in dated]
+
+    buckets = {}
+    for src in (newest_first(core["financials"]["quarterly"]["periods"]),
+                newest_first(core["financials"]["annual"]["periods"])):
+        for p in src:
+            sig = _extract_period_date(p).strftime("%Y-%m-%d")
+            if sig not in buckets:
+                buckets[sig] = p
+    return newest_first(list(buckets.values()))
+
+
+def _core(quarterly, annual):
+    return {"financials": {"quarterly": {"periods": quarterly}, "annual": {"periods": annual}}}
+
+
+def test_quarterly_wins_same_day_ties():
+    q = {"statement_date": "2024-12-31", "src": "q"}
+    a = {"statement_date": "2024-12-31T00:00:00Z", "src": "a"}
+    older = {"statement_date": "2023-12-31", "src": "a"}
+    assert all_periods_sorted(_core([q], [older, a])) == [q, older]
+
+
+def test_matches_reference_on_random_inputs():
+    rng = random.Random(3)
+    fmts = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S")
+    for _ in range(500):
+        def snap(tag):
+            if rng.random() < 0.1:
+                return {"src": tag}  # undated, dropped
+            d = _BASE - timedelta(days=rng.randrange(0, 1500, 30), hours=rng.choice((0, 0, 9)))
+            return {"statement_date": d.strftime(rng.choice(fmts)), "src": tag}
+        q = [snap("q") for _ in range(rng.randint(0, 10))]
+        a = [snap("a") for _ in range(rng.randint(0, 5))]
+        core = _core(q, a)
+        assert all_periods_sorted(core) == _reference_all_periods_sorted(core)
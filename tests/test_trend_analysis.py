@@ -0,0 +1,109 @@
+# tests/test_trend_analysis.py
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from domain.services.period_accessors import get_shares_out
+from domain.services.periods import _extract_period_date
+from domain.services.trend_analysis import (
+    _QOQ_GAP, _HOH_GAP, _YOY_GAP,
+    _dated_gaps, _max_change_pairwise, _max_change_sliding, _max_change_within_days,
+    _pair_from_gaps, pct_change, trend_pairs,
+)
+
+_BASE = datetime(2025, 12, 31)
+
+
+def _reference_max_change(periods, window_days):
+    # the original every-pair scan over period dicts
+    dated = [(p, _extract_period_date(p)) for p in periods]
+    dated = [(p, d) for (p, d) in dated if d is not None]
+    max_issue = max_buyback = None
+    for i in range(len(dated)):
+        p_new, d_new = dated[i]
+        for p_old, d_old in dated[i + 1:]:
+            gap = (d_new - d_old).days
+            if gap < 0 or gap > window_days:
+                continue
+            chg = pct_change(get_shares_out(p_old), get_shares_out(p_new))
+            if chg is None:
+                continue
+            if max_issue is None or chg > max_issue:
+                max_issue = chg
+            if max_buyback is None or chg < max_buyback:
+                max_buyback = chg
+    return max_issue, max_buyback
+
+
+def _period(days_back, shares):
+    return {"statement_date": (_BASE - timedelta(days=days_back)).strftime("%Y-%m-%d"), "shares_out": shares}
+
+
+def _periods(rng, n, sort=True, dup=False):
+    days = sorted(rng.sample(range(0, 2500), n))
+    if dup and n > 1:
+        days[rng.randrange(1, n)] = days[0]
+    out = [_period(d, float(rng.randint(1, 5) * 1_000_000)) for d in days]
+    if not sort:
+        rng.shuffle(out)
+    return out
+
+
+@pytest.mark.parametrize("sort,dup", [(True, False), (False, False), (True, True)])
+@pytest.mark.parametrize("window", [365, 1095])
+def test_max_change_matches_pairwise_reference(sort, dup, window):
+    rng = random.Random(f"{sort}{dup}{window}")
+    for _ in range(300):
+        periods = _periods(rng, rng.randint(0, 25), sort=sort, dup=dup)
+        stats = _max_change_within_days(periods, window)
+        assert (stats.max_issue, stats.max_buyback) == _reference_max_change(periods, window)
+
+
+def test_sliding_equals_pairwise_on_sorted_points():
+    rng = random.Random(7)
+    for _ in range(300):
+        days = sorted(rng.sample(range(0, 2500), rng.randint(0, 25)))
+        pts = [(_BASE - timedelta(days=d), float(rng.randint(1, 9))) for d in days]
+        for window in (0, 90, 365, 1095):
+            assert _max_change_sliding(pts, window) == _max_change_pairwise(pts, window)
+
+
+def test_window_edge_is_inclusive():
+    periods = [_period(0, 120.0), _period(365, 100.0), _period(731, 50.0)]  # 366 days past the middle one
+    stats = _max_change_within_days(periods, 365)
+    assert stats.max_issue == pytest.approx(0.2)
+    assert stats.max_buyback == pytest.approx(0.2)
+
+
+def _reference_pair(periods, approx_days, tolerance_days):
+    # the original linear scan for a partner ~approx_days older than the newest period
+    dated = [(p, _extract_period_date(p)) for p in periods]
+    dated = [(p, d) for (p, d) in dated if d is not None]
+    if len(dated) < 2:
+        return None
+    newer, newer_dt = dated[0]
+    for older, older_dt in dated[1:]:
+        if abs((newer_dt - older_dt).days - approx_days) <= tolerance_days:
+            return (newer, older)
+    return (newer, dated[1][0])
+
+
+def test_pair_from_gaps_matches_linear_scan():
+    rng = random.Random(11)
+    for _ in range(500):
+        periods = _periods(rng, rng.randint(0, 12))
+        periods.sort(key=_extract_period_date, reverse=True)
+        if periods and rng.random() < 0.2:
+            periods.insert(rng.randrange(len(periods) + 1), {"shares_out": 1.0})  # undated
+        dated, gaps = _dated_gaps(periods)
+        expected = tuple(_reference_pair(periods, *gap) for gap in (_QOQ_GAP, _HOH_GAP, _YOY_GAP))
+        assert trend_pairs(periods) == expected
+        for gap, want in zip((_QOQ_GAP, _HOH_GAP, _YOY_GAP), expected):
+            assert _pair_from_gaps(dated, gaps, *gap) == want
+
+
+def test_pair_from_gaps_falls_back_to_first_two():
+    periods = [_period(0, 1.0), _period(10, 1.0), _period(1000, 1.0)]
+    dated, gaps = _dated_gaps(periods)
+    assert _pair_from_gaps(dated, gaps, *_QOQ_GAP) == (periods[0], periods[1])
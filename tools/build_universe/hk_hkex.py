@@ -3,8 +3,17 @@ from pathlib import Path
 from urllib.parse import urljoin
 from datetime import datetime, timezone
 import io, os, re, sys, runpy, json
+import numpy as np
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional: Rust xlsx reader, much faster than openpyxl on the HKEX list
+    import python_calamine  # noqa: F401
+    XLSX_ENGINE = "calamine"
+except ImportError:
+    XLSX_ENGINE = "openpyxl"
 
 # ---------- Paths ----------
 ROOT = Path(__file__).resolve().parents[2]
@@ -31,6 +40,11 @@ DUMB_HKEX_CSV = "https://dumbstockapi.com/stock?format=csv&exchanges=HKEX"
 
 NUM4 = re.compile(r"^\d{4}$")
 
+# one pooled session per process, shared by every download path / fallback
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=3, backoff_factor=0.5)))
+
 # ---------- Meta helper ----------
 def _write_meta(source: str, rows: int):
     meta = {
@@ -42,6 +56,19 @@ def _write_meta(source: str, rows: int):
     OUT_META.write_text(json.dumps(meta, indent=2), encoding="utf-8")
 
 # ---------- Utilities ----------
+def _code4(col: pd.Series) -> pd.Series:
+    """Stock codes -> zero-padded 4+ digit text (first run of up to 5 digits; none -> "0000")."""
+    s = col.astype(str)
+    # plain ASCII digit strings (the usual case) skip the regex entirely
+    fast = (s.str.isascii() & s.str.isdigit() & (s.str.len() <= 5)).to_numpy(dtype=bool)
+    out = np.empty(len(s), dtype=object)
+    if fast.any():
+        out[fast] = np.char.zfill(s[fast].to_numpy(dtype="int64").astype("U5"), 4)
+    if not fast.all():
+        slow = s[~fast].str.extract(r"(\d{1,5})")[0].fillna("0").astype(int).astype(str).str.zfill(4)
+        out[~fast] = slow.to_numpy()
+    return pd.Series(out, index=col.index, dtype=str)
+
 def _write_out(df: pd.DataFrame, tag: str) -> pd.DataFrame:
     """Normalize and write hk_full.csv + meta"""
     if df is None or df.empty:
@@ -54,10 +81,7 @@ def _write_out(df: pd.DataFrame, tag: str) -> pd.DataFrame:
     out = df.copy()
     if "ticker_base" not in out.columns and "stock_code" in out.columns:
         out["ticker_base"] = out["stock_code"]
-    out["ticker_base"] = (
-        out["ticker_base"].astype(str).str.extract(r"(\d{1,5})")[0]
-        .fillna("0").astype(int).astype(str).str.zfill(4)
-    )
+    out["ticker_base"] = _code4(out["ticker_base"])
     out = out[out["ticker_base"].str.match(NUM4)]
     if "name" not in out.columns:
         for c in ["Name of Securities", "securities name", "english short name"]:
@@ -98,27 +122,31 @@ def _from_sehk_builder() -> pd.DataFrame:
 
 # ---------- Path B: Directly parse the official Excel ----------
 # (same parsing logic as your working version; meta handled by _write_out)
+_HEADER_SYN = {
+    "stock code": "Stock Code","stockcode": "Stock Code","sehk code": "Stock Code","code": "Stock Code",
+    "name of securities": "Name of Securities","securities name": "Name of Securities",
+    "english short name": "Name of Securities","security name": "Name of Securities",
+    "category": "Category","class": "Category","type": "Category",
+    "sub-category": "Sub-Category","subcategory": "Sub-Category","sub category": "Sub-Category",
+    "board lot": "Board Lot","boardlot": "Board Lot","lot size": "Board Lot",
+    "isin": "ISIN","isin code": "ISIN",
+    "股份代號": "Stock Code","證券名稱": "Name of Securities","股票名稱": "Name of Securities",
+    "類別": "Category","次類別": "Sub-Category","買賣單位": "Board Lot","國際證券號碼": "ISIN",
+}
+_WS_RE = re.compile(r"\s+")
+_PAREN_RE = re.compile(r"[\(\)（）].*$")
+
 def _canonize_header(cells) -> dict[int,str]:
-    SYN = {
-        "stock code": "Stock Code","stockcode": "Stock Code","sehk code": "Stock Code","code": "Stock Code",
-        "name of securities": "Name of Securities","securities name": "Name of Securities",
-        "english short name": "Name of Securities","security name": "Name of Securities",
-        "category": "Category","class": "Category","type": "Category",
-        "sub-category": "Sub-Category","subcategory": "Sub-Category","sub category": "Sub-Category",
-        "board lot": "Board Lot","boardlot": "Board Lot","lot size": "Board Lot",
-        "isin": "ISIN","isin code": "ISIN",
-        "股份代號": "Stock Code","證券名稱": "Name of Securities","股票名稱": "Name of Securities",
-        "類別": "Category","次類別": "Sub-Category","買賣單位": "Board Lot","國際證券號碼": "ISIN",
-    }
     out = {}
     for j, raw in enumerate(cells):
         if raw is None: continue
         s = str(raw).strip()
-        if not s or s.lower().startswith("unnamed"): continue
-        key = SYN.get(s.lower()) or SYN.get(re.sub(r"\s+"," ", s.lower()))
+        low = s.lower()
+        if not s or low.startswith("unnamed"): continue
+        key = _HEADER_SYN.get(low) or _HEADER_SYN.get(_WS_RE.sub(" ", low))
         if not key:
-            s2 = re.sub(r"[\(\)（）].*$","", s).strip().lower()
-            key = SYN.get(s2)
+            s2 = _PAREN_RE.sub("", s).strip().lower()
+            key = _HEADER_SYN.get(s2)
         if key: out[j] = key
     return out
 
@@ -141,21 +169,26 @@ def _sheet_to_table(xl: pd.ExcelFile, sheet_name: str) -> pd.DataFrame | None:
     data = data[keep].dropna(how="all")
     return data
 
-def _is_equity(cat: str, subcat: str) -> bool:
-    deny = {"cbbc","callable bull/bear contracts","warrants","derivative warrants","warrant",
-            "bond","bonds","debt","notes","perpetual","etf","exchange traded funds","fund","trust","reit",
-            "rights","preference","stapled","structured","equity linked"}
-    allow = {"equity","ordinary shares","common shares","primary equity","secondary equity"}
-    c = (str(cat) or "").strip().lower(); s = (str(subcat) or "").strip().lower()
-    if any(t in c for t in deny) or any(t in s for t in deny): return False
-    if any(t in c for t in allow) or any(t in s for t in allow): return True
-    if "equity" in c or "equity" in s or "ordinary" in s: return True
-    return False
+_EQUITY_DENY = ("cbbc","callable bull/bear contracts","warrants","derivative warrants","warrant",
+                "bond","bonds","debt","notes","perpetual","etf","exchange traded funds","fund","trust","reit",
+                "rights","preference","stapled","structured","equity linked")
+_EQUITY_ALLOW = ("equity","ordinary shares","common shares","primary equity","secondary equity")
+_DENY_RE = re.compile("|".join(map(re.escape, _EQUITY_DENY)))
+_ALLOW_RE = re.compile("|".join(map(re.escape, _EQUITY_ALLOW)))
+_LOOSE_SUB_RE = re.compile("equity|ordinary")
+
+def _equity_mask(cat: pd.Series, subcat: pd.Series) -> pd.Series:
+    """Column-wise equity test: any deny token rejects, then an allow token / 'equity' / 'ordinary' (sub-category) accepts."""
+    c = cat.astype(str).str.strip().str.lower(); s = subcat.astype(str).str.strip().str.lower()
+    deny = c.str.contains(_DENY_RE, regex=True) | s.str.contains(_DENY_RE, regex=True)
+    allow = c.str.contains(_ALLOW_RE, regex=True) | s.str.contains(_ALLOW_RE, regex=True)
+    loose = c.str.contains("equity", regex=False) | s.str.contains(_LOOSE_SUB_RE, regex=True)
+    return ~deny & (allow | loose)
 
 def _from_official_xls() -> pd.DataFrame:
-    s = requests.Session()
+    s = SESSION
     content = _download(s, SEHK_XLS)
-    xl = pd.ExcelFile(io.BytesIO(content), engine="openpyxl")
+    xl = pd.ExcelFile(io.BytesIO(content), engine=XLSX_ENGINE)
     tables = []
     for sheet in xl.sheet_names:
         t = _sheet_to_table(xl, sheet)
@@ -167,14 +200,14 @@ def _from_official_xls() -> pd.DataFrame:
     df["Name of Securities"] = df["Name of Securities"].astype(str).str.strip()
     df["Category"] = df.get("Category", "").astype(str).str.strip()
     df["Sub-Category"] = df.get("Sub-Category","").astype(str).str.strip()
-    mask = df.apply(lambda r: _is_equity(r.get("Category",""), r.get("Sub-Category","")), axis=1)
+    mask = _equity_mask(df["Category"], df["Sub-Category"])
     base = df[mask].drop_duplicates(subset=["Stock Code"]).copy()
     base = base.rename(columns={"Stock Code":"ticker_base","Name of Securities":"name"})
     return _write_out(base[["ticker_base","name"]], tag="excel")
 
 # ---------- Other paths (unchanged except meta handled by _write_out) ----------
 def _from_hkex_html() -> pd.DataFrame:
-    s = requests.Session()
+    s = SESSION
     for page in CANDIDATE_PAGES:
         try:
             content = _download(s, page)
@@ -203,7 +236,7 @@ def _from_hkex_html() -> pd.DataFrame:
 
 def _from_consolidated() -> pd.DataFrame:
     try:
-        s = requests.Session()
+        s = SESSION
         csv = _download(s, DUMB_HKEX_CSV)
         df = pd.read_csv(io.BytesIO(csv))
         if {"ticker","name","exchange"}.issubset(df.columns):
@@ -233,7 +266,7 @@ def fetch_list() -> pd.DataFrame:
     except Exception as e: print(f"[HKEX:builder] failed: {e}")
     if ENV_URL:
         try:
-            s = requests.Session()
+            s = SESSION
             content = _download(s, ENV_URL)
             try:
                 df = pd.read_csv(io.BytesIO(content))
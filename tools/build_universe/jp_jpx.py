@@ -5,6 +5,8 @@ import os, re, io, json
 import requests
 import pandas as pd
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 ROOT = Path(__file__).resolve().parents[2]
 DATA = ROOT / "data" / "tickers"
@@ -24,6 +26,11 @@ XLS_PAT = re.compile(r"Primary_Listing_Markets\.xls$", re.IGNORECASE)
 CODE_PAT = re.compile(r"^\d{4}$")
 DUMB_JPX_CSV = "https://dumbstockapi.com/stock?format=csv&exchanges=JPX"
 
+# one pooled session per process, shared by every download path / fallback
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=3, backoff_factor=0.5)))
+
 def _download(s: requests.Session, url: str) -> bytes:
     r = s.get(url, timeout=60); r.raise_for_status(); return r.content
 
@@ -46,7 +53,10 @@ def _parse_primary_xls(content: bytes) -> pd.DataFrame:
         if ("name" in k and "stock" in k) or ("name" in k) or ("銘柄" in k): name_col = c
     if code_col is None or name_col is None: code_col, name_col = list(df.columns)[:2]
     out = df[[code_col, name_col]].copy(); out.columns = ["ticker_base","name"]
-    out["ticker_base"] = out["ticker_base"].astype(str).str.extract(r"(\d{4})")[0]
+    code = out["ticker_base"].astype(str)
+    # plain 4-digit codes (the usual case) skip the regex
+    fast = (code.str.len() == 4) & code.str.isascii() & code.str.isdigit()
+    out["ticker_base"] = code.where(fast, code[~fast].str.extract(r"(\d{4})")[0])
     out = out.dropna(subset=["ticker_base","name"]); out = out[out["ticker_base"].str.match(CODE_PAT)]
     out["ticker"] = out["ticker_base"] + ".JP"; out["country"] = "JP"; out["mic"] = "XJPX"
     return out.drop_duplicates("ticker_base").reset_index(drop=True)
@@ -68,7 +78,7 @@ def _write(df: pd.DataFrame, source: str):
     print(f"✅ JP: {len(df)} rows ({source}) → {OUT}")
 
 def fetch_list() -> pd.DataFrame:
-    s = requests.Session()
+    s = SESSION
     # A) ENV xls
     if ENV_XLS:
         try:
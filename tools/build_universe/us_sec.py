@@ -5,6 +5,11 @@ from datetime import datetime, timezone
 import requests
 import pandas as pd
 
+try:  # optional: parses/dumps the ~2MB SEC payload several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[2]
 DATA = ROOT / "data" / "tickers"
 DATA.mkdir(parents=True, exist_ok=True)
@@ -16,8 +21,8 @@ CACHE_JSON.parent.mkdir(parents=True, exist_ok=True)
 
 SEC_UA = os.environ.get("SEC_USER_AGENT", "net_net_screener_global/1.0 (yourname@email.com)")
 
-BAD_NAME_PAT = re.compile(r"(warrant|wts|rights?|unit|spac|acquisition|blank\s*check|trust|holding\s*co)", re.IGNORECASE)
-BAD_CODE_PAT = re.compile(r"(-WT|-WTS|-WS|-U|-UN|-RT|-R|\s+WTS?|\s+UNIT|\s+RT)$", re.IGNORECASE)
+BAD_NAME_PAT = re.compile(r"(?:warrant|wts|rights?|unit|spac|acquisition|blank\s*check|trust|holding\s*co)", re.IGNORECASE)
+BAD_CODE_PAT = re.compile(r"(?:-WT|-WTS|-WS|-U|-UN|-RT|-R|\s+WTS?|\s+UNIT|\s+RT)$", re.IGNORECASE)
 
 def get_session() -> requests.Session:
     s = requests.Session()
@@ -28,39 +33,40 @@ def fetch_company_tickers(sec: requests.Session) -> list[dict]:
     url = "https://www.sec.gov/files/company_tickers.json"
     r = sec.get(url, timeout=30)
     r.raise_for_status()
-    data = r.json()
-    CACHE_JSON.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    rows: list[dict] = []
-    it = data.items() if isinstance(data, dict) else enumerate(data)
-    for _, row in it:
-        t = (row.get("ticker") or "").strip().upper()
-        if not t:
-            continue
-        rows.append({
+    if orjson is not None:
+        data = orjson.loads(r.content)
+        CACHE_JSON.write_bytes(orjson.dumps(data))  # raw cache, nothing reads it back pretty
+    else:
+        data = r.json()
+        CACHE_JSON.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    entries = data.values() if isinstance(data, dict) else data
+    pairs = (((row.get("ticker") or "").strip().upper(), row) for row in entries)
+    return [
+        {
             "ticker_base": t,
             "ticker": f"{t}.US",
             "name": (row.get("title") or "").strip(),
             "cik": int(row.get("cik_str", 0) or 0),
             "country": "US",
             "mic": "XNAS",
-        })
-    return rows
-
-def looks_like_common(row) -> bool:
-    name = row.get("name", "") or ""
-    code = row.get("ticker_base", "") or ""
-    if BAD_NAME_PAT.search(name): return False
-    if BAD_CODE_PAT.search(code): return False
-    return True
-
-def sym_score(sym: str) -> int:
-    s = sym or ""
-    score = 0
-    if any(ch.isdigit() for ch in s): score += 10
-    if s.endswith("F"): score += 5
-    if s.endswith("Y"): score += 5
-    score += len(s)
-    return score
+        }
+        for t, row in pairs
+        if t
+    ]
+
+def looks_like_common(df: pd.DataFrame) -> pd.Series:
+    """False where the name or the ticker code looks like a warrant/unit/right/SPAC/trust line."""
+    name = df["name"].fillna("").astype(str)
+    code = df["ticker_base"].fillna("").astype(str)
+    return ~(name.str.contains(BAD_NAME_PAT) | code.str.contains(BAD_CODE_PAT))
+
+def sym_score(sym: pd.Series) -> pd.Series:
+    """Lower is the plainer share-class symbol: digits +10, trailing F/Y +5, plus length."""
+    s = sym.fillna("").astype(str)
+    return (s.str.contains(r"\d").astype(int) * 10
+            + s.str.endswith("F").astype(int) * 5
+            + s.str.endswith("Y").astype(int) * 5
+            + s.str.len())
 
 def fetch_list() -> pd.DataFrame:
     s = get_session()
@@ -69,11 +75,10 @@ def fetch_list() -> pd.DataFrame:
     before = len(df)
 
     df = df.dropna(subset=["ticker_base", "ticker"]).drop_duplicates("ticker_base")
-    mask_common = df.apply(looks_like_common, axis=1)
-    df = df[mask_common].copy()
+    df = df[looks_like_common(df)].copy()
     df = df[df["cik"] > 0].copy()
 
-    df["__score"] = df["ticker_base"].astype(str).map(sym_score)
+    df["__score"] = sym_score(df["ticker_base"])
     df = (df.sort_values(["cik", "__score", "ticker_base"]).groupby("cik", as_index=False).first())
 
     df = df[["ticker", "name", "cik", "ticker_base", "country", "mic"]].sort_values("ticker").reset_index(drop=True)
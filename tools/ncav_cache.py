@@ -2,14 +2,22 @@
 from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import Optional, List, Tuple, Callable, Dict
+from typing import Optional, List, Tuple, Callable, Dict, Iterator
 from datetime import datetime, timezone, timedelta
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
-import json, hashlib, os, time, random, re
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
+import atexit, json, hashlib, math, os, time, random, re, threading
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
+try:  # optional: C serializer for the per-ticker cache records
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------- Paths ----------
 ROOT = Path(__file__).resolve().parents[1]
 CACHE = ROOT / "cache" / "ncav"
@@ -17,30 +25,125 @@ CACHE.mkdir(parents=True, exist_ok=True)
 
 # ---------- Rate limit & retry (Yahoo throttles) ----------
 class RateLimiter:
+    """
+    Jittered request slots 1/rps apart, shared by every fetch thread. The rate adapts
+    (AIMD): +RPS_STEP per successful call, halved on throttling. The configured rps is
+    the ceiling; cuts stop at MIN_RPS (or at the configured rps, if that is lower).
+    """
+    MIN_RPS, RPS_STEP = 0.2, 0.05
+
     def __init__(self, rps: float = 2.0):
-        self.dt = 1.0 / max(0.1, rps)
+        self._lock = threading.Lock()
+        self.max_rps = max(1e-3, rps)  # only guards against 0; a low user setting stands
+        self.min_rps = min(self.MIN_RPS, self.max_rps)
+        self._set_rps(self.max_rps)
         self.next_t = 0.0
+        self._cut_t = float("-inf")
+        self.used = False  # any request made through this limiter (worth saving its state)
+    def _set_rps(self, rps: float):
+        self.rps = min(self.max_rps, max(self.min_rps, rps))
+        self.dt = 1.0 / self.rps
     def wait(self):
-        now = time.monotonic()
-        if now < self.next_t:
-            time.sleep(self.next_t - now)
-        self.next_t = time.monotonic() + self.dt + random.uniform(0, self.dt * 0.15)
+        # reserve the slot under the lock, sleep outside it
+        with self._lock:
+            self.used = True
+            now = time.monotonic()
+            slot = max(now, self.next_t)
+            self.next_t = slot + self.dt + random.uniform(0, self.dt * 0.15)
+        if slot > now:
+            time.sleep(slot - now)
+    def on_success(self):
+        with self._lock:
+            self._set_rps(self.rps + self.RPS_STEP)
+    def on_throttle(self):
+        with self._lock:
+            self.used = True
+            now = time.monotonic()
+            # threads throttled by the same burst count once
+            if now - self._cut_t >= self.dt:
+                self._set_rps(self.rps / 2)
+                self._cut_t = now
 
 YF_RPS = float(os.environ.get("YF_RPS", "2.0"))
-_RL = RateLimiter(YF_RPS)
 
-def _retry(fn: Callable[[], any], attempts=4, base=1.2):
+# limiter state carried between CLI runs, so back-to-back runs don't start with a burst
+_RL_STATE = CACHE / "_rate_limiter.state"
+_RL_STATE_MAX_AGE = 3600.0  # a learned rate older than this says little about Yahoo's current limit
+
+def _load_limiter() -> RateLimiter:
+    rl = RateLimiter(YF_RPS)
+    try:
+        st = json.loads(_RL_STATE.read_text(encoding="utf-8"))
+        if time.time() - float(st["saved_at"]) < _RL_STATE_MAX_AGE:
+            # a rate learned before YF_RPS was lowered must not outrank the new setting
+            rl._set_rps(min(float(st["rps"]), YF_RPS))
+        # next free slot: wall clock on disk -> this process's monotonic clock
+        rl.next_t = time.monotonic() + max(0.0, float(st["next_wall"]) - time.time())
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return rl
+
+def _save_limiter() -> None:
+    # a process that never hit Yahoo (cache hits only, or just importing the module)
+    # leaves the file alone, so its saved_at still ages out after _RL_STATE_MAX_AGE
+    if not _RL.used:
+        return
+    try:
+        with _RL._lock:
+            st = {"rps": _RL.rps, "next_wall": time.time() + max(0.0, _RL.next_t - time.monotonic()),
+                  "saved_at": time.time()}
+        tmp = _RL_STATE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(st), encoding="utf-8")
+        os.replace(tmp, _RL_STATE)  # an interrupted exit never leaves a half-written state file
+    except OSError:
+        pass
+
+_RL = _load_limiter()
+atexit.register(_save_limiter)
+
+_RETRYABLE = ("401","403","429","500","502","503","504","timed out")
+
+def _retry_after(e: Exception) -> Optional[float]:
+    """Seconds asked for by a Retry-After header on the exception's HTTP response, if any."""
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    raw = headers.get("Retry-After") if hasattr(headers, "get") else None
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:  # HTTP-date form
+        return max(0.0, (parsedate_to_datetime(raw) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+def _retry(fn: Callable[[], any], attempts=4, base=1.2, cap=12.0):
+    # cap stays near the default fetch_timeout: longer sleeps only hold a pool thread after the caller gave up
     last = None
+    sleep = base
     for i in range(attempts):
         try:
             _RL.wait()
-            return fn()
+            out = fn()
+            _RL.on_success()
+            return out
         except Exception as e:
             last = e
             s = str(e).lower()
-            if not any(t in s for t in ["401","403","429","500","502","503","504","timed out"]):
+            throttled = type(e).__name__ == "YFRateLimitError" or "429" in s
+            if throttled:
+                _RL.on_throttle()
+            elif not any(t in s for t in _RETRYABLE):
                 break
-            time.sleep(min(12.0, base * (2 ** i) * (1 + random.uniform(-0.2, 0.2))))
+            if i == attempts - 1:
+                break  # no point sleeping before giving up
+            wait = _retry_after(e)
+            if wait is None:
+                # decorrelated jitter: threads that failed together don't retry together
+                sleep = min(cap, random.uniform(base, sleep * 3))
+                wait = sleep
+            time.sleep(min(cap, wait))
     raise last if last else RuntimeError("yfinance error")
 
 # ---------- Mapping (house → Yahoo) ----------
@@ -84,28 +187,51 @@ def _norm_date(x) -> Optional[str]:
         return None
 
 # ---------- Row picker (robust) ----------
-def _pick(df: pd.DataFrame, names: List[str]) -> Optional[pd.Series]:
-    if df is None or df.empty: return None
-    def norm(s: str) -> str:
-        s = s.strip().lower()
-        s = re.sub(r"[\s\-_]+", "", s)
-        s = re.sub(r"[^\w]", "", s)
-        return s
-    idxmap = {norm(str(i)): i for i in df.index}
-    syn = {
-        "totalcurrentassets": ["totalcurrentassets","currentassets","currentassetstotal","totalcurrentasset"],
-        "totalliabilities": ["totalliabilities","totalliab","liabilitiestotal","totalliabilitiesnetminorityinterest"],
-        "totalcurrentliabilities": ["totalcurrentliabilities","currentliabilities","currentliabilitiestotal"],
-        "totalnoncurrentliabilities": ["totalnoncurrentliabilities","noncurrentliabilities","noncurrentliabilitiestotal"],
-        "totalassets": ["totalassets"],
-        "noncurrentassets": ["noncurrentassets","totalnoncurrentassets","non-currentassets","noncurrentassetstotal"],
-        "workingcapital": ["workingcapital"],
-    }
+_NORM_SEP_RE = re.compile(r"[\s\-_]+")
+_NORM_NONWORD_RE = re.compile(r"[^\w]")
+_SYN = {
+    "totalcurrentassets": ["totalcurrentassets","currentassets","currentassetstotal","totalcurrentasset"],
+    "totalliabilities": ["totalliabilities","totalliab","liabilitiestotal","totalliabilitiesnetminorityinterest"],
+    "totalcurrentliabilities": ["totalcurrentliabilities","currentliabilities","currentliabilitiestotal"],
+    "totalnoncurrentliabilities": ["totalnoncurrentliabilities","noncurrentliabilities","noncurrentliabilitiestotal"],
+    "totalassets": ["totalassets"],
+    "noncurrentassets": ["noncurrentassets","totalnoncurrentassets","non-currentassets","noncurrentassetstotal"],
+    "workingcapital": ["workingcapital"],
+}
+
+@lru_cache(maxsize=4096)
+def _norm(s: str) -> str:
+    s = s.strip().lower()
+    s = _NORM_SEP_RE.sub("", s)
+    s = _NORM_NONWORD_RE.sub("", s)
+    return s
+
+@lru_cache(maxsize=None)
+def _expand(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Normalized lookup names, each followed by its synonym list."""
     expanded = []
     for n in names:
-        n0 = norm(n); expanded.append(n0)
-        for key, arr in syn.items():
+        n0 = _norm(n); expanded.append(n0)
+        for key, arr in _SYN.items():
             if n0 == key or n0 in arr: expanded += arr
+    return tuple(expanded)
+
+# normalized label -> original label for the last index seen; _pick runs ~7x per
+# statement column against the same frame. Holding the Index keeps the identity check sound.
+_IDXMAP_LAST: Tuple[Optional[pd.Index], Dict[str, object]] = (None, {})
+
+def _idxmap(df: pd.DataFrame) -> Dict[str, object]:
+    global _IDXMAP_LAST
+    index, idxmap = _IDXMAP_LAST
+    if index is not df.index:
+        idxmap = {_norm(str(i)): i for i in df.index}
+        _IDXMAP_LAST = (df.index, idxmap)  # one tuple swap, so threads never see a torn pair
+    return idxmap
+
+def _pick(df: pd.DataFrame, names: Tuple[str, ...]) -> Optional[pd.Series]:
+    if df is None or df.empty: return None
+    idxmap = _idxmap(df)
+    expanded = _expand(tuple(names))
     # exact
     for n0 in expanded:
         if n0 in idxmap: return df.loc[idxmap[n0]]
@@ -116,60 +242,96 @@ def _pick(df: pd.DataFrame, names: List[str]) -> Optional[pd.Series]:
     return None
 
 # ---------- Per-column extraction with derivations ----------
-def _values_for_column(df: pd.DataFrame, col) -> Dict[str, Optional[float]]:
-    ca_s  = _pick(df, ["Total Current Assets","Current Assets"])
-    ta_s  = _pick(df, ["Total Assets"])
-    nca_s = _pick(df, ["Non Current Assets","Total Non Current Assets","Non-Current Assets","Noncurrent Assets"])
-    tl_s  = _pick(df, ["Total Liab","Total Liabilities","Total Liabilities Net Minority Interest","Liabilities Total"])
-    cl_s  = _pick(df, ["Total Current Liabilities","Current Liabilities"])
-    ncl_s = _pick(df, ["Total Non-Current Liabilities","Non Current Liabilities","Non-Current Liabilities"])
-    wc_s  = _pick(df, ["Working Capital"])
-
-    ta  = _f(ta_s.get(col))  if ta_s  is not None else None
-    nca = _f(nca_s.get(col)) if nca_s is not None else None
-    tl  = _f(tl_s.get(col))  if tl_s  is not None else None
-    cl  = _f(cl_s.get(col))  if cl_s  is not None else None
-    ncl = _f(ncl_s.get(col)) if ncl_s is not None else None
-    wc  = _f(wc_s.get(col))  if wc_s  is not None else None
-
-    ca  = _f(ca_s.get(col))  if ca_s  is not None else None
-    if cl is None and tl is not None and ncl is not None:
-        cl = tl - ncl
-    if ca is None and wc is not None and cl is not None:
-        ca = wc + cl
-    if ca is None and ta is not None and nca is not None:
-        ca = ta - nca
-    if tl is None and cl is not None and ncl is not None:
-        tl = cl + ncl
-
-    return {"assets_current": ca, "liab_total": tl}
+_FIELD_ROWS = (
+    ("ca",  ("Total Current Assets","Current Assets")),
+    ("ta",  ("Total Assets",)),
+    ("nca", ("Non Current Assets","Total Non Current Assets","Non-Current Assets","Noncurrent Assets")),
+    ("tl",  ("Total Liab","Total Liabilities","Total Liabilities Net Minority Interest","Liabilities Total")),
+    ("cl",  ("Total Current Liabilities","Current Liabilities")),
+    ("ncl", ("Total Non-Current Liabilities","Non Current Liabilities","Non-Current Liabilities")),
+    ("wc",  ("Working Capital",)),
+)
+
+def _pick_rows(df: pd.DataFrame) -> Dict[str, Optional[pd.Series]]:
+    """Statement row behind each field; rows don't depend on the column, so resolve once per frame."""
+    return {field: _pick(df, names) for field, names in _FIELD_ROWS}
+
+def _row_values(s, n_cols: int) -> np.ndarray:
+    """One statement row as float64 per column, NaN where missing or unparseable."""
+    if not isinstance(s, pd.Series):
+        # no such row, or a duplicated label (loc gave a frame; the per-cell get() never parsed those)
+        return np.full(n_cols, np.nan)
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        return s.to_numpy(dtype="float64", na_value=np.nan)
+    return np.array([np.nan if (v := _f(x)) is None else v for x in s], dtype="float64")
+
+def _values_for_columns(df: pd.DataFrame, rows: Dict[str, Optional[pd.Series]]) -> List[Dict[str, Optional[float]]]:
+    """assets_current / liab_total for every column of df, derivations done column-wise in numpy."""
+    n = len(df.columns)
+    v = {field: _row_values(s, n) for field, s in rows.items()}
+    if not df.columns.is_unique:
+        # a repeated date label never resolved to a single cell
+        dup = df.columns.duplicated(keep=False)
+        v = {field: np.where(dup, np.nan, arr) for field, arr in v.items()}
+    ta, nca, tl, cl, ncl, wc, ca = v["ta"], v["nca"], v["tl"], v["cl"], v["ncl"], v["wc"], v["ca"]
+
+    cl = np.where(np.isnan(cl), tl - ncl, cl)
+    ca = np.where(np.isnan(ca), wc + cl, ca)
+    ca = np.where(np.isnan(ca), ta - nca, ca)
+    tl = np.where(np.isnan(tl), cl + ncl, tl)
+
+    return [
+        {"assets_current": None if np.isnan(a) else a, "liab_total": None if np.isnan(t) else t}
+        for a, t in zip(ca.tolist(), tl.tolist())
+    ]
+
+def _column_date(col) -> Tuple[Optional[str], Optional[pd.Timestamp]]:
+    """(ISO date, midnight Timestamp) for a statement column label; Timestamps skip the string round-trip."""
+    if isinstance(col, pd.Timestamp):
+        d = col.date()
+        return d.isoformat(), pd.Timestamp(d)
+    di = _norm_date(col)
+    try:
+        dt = pd.to_datetime(di)
+    except Exception:
+        dt = None
+    return di, dt
 
 # ---------- Build unified candidate list (annual + quarterly), newest → oldest ----------
-def _collect_candidates(bs_a: pd.DataFrame, bs_q: pd.DataFrame) -> List[dict]:
-    cands: List[dict] = []
+def _iter_candidates(bs_a: pd.DataFrame, bs_q: pd.DataFrame) -> Iterator[dict]:
+    """
+    Candidates newest → oldest, quarterly first on a date tie. Only the column dates are
+    parsed up front; a frame's values are computed when its first column comes up, so a
+    hit on the newest quarterly column never touches the annual frame.
+    """
+    cols = []
     for source, df in (("annual", bs_a), ("quarterly", bs_q)):
         if df is None or df.empty:
             continue
-        for col in df.columns:
-            di = _norm_date(col)
-            try:
-                dt = pd.to_datetime(di)
-            except Exception:
-                dt = None
-            vals = _values_for_column(df, col)  # NaN-safe via _f
-            cands.append({
-                "date_iso": di,
-                "dt": dt,
-                "vals": vals,
-                "source": source,
-            })
-    # newest → oldest across both; if tie on date, prefer quarterly
+        for pos, col in enumerate(df.columns):
+            di, dt = _column_date(col)
+            cols.append((source, df, pos, di, dt))
     def _key(c):
-        dt = c["dt"] if c["dt"] is not None else pd.Timestamp.min
-        prio = 1 if c["source"] == "quarterly" else 0
+        dt = c[4] if c[4] is not None else pd.Timestamp.min
+        prio = 1 if c[0] == "quarterly" else 0
         return (dt, prio)
-    cands.sort(key=_key, reverse=True)
-    return cands
+    cols.sort(key=_key, reverse=True)
+
+    frame_vals: Dict[str, List[dict]] = {}
+    for source, df, pos, di, dt in cols:
+        vals = frame_vals.get(source)
+        if vals is None:
+            vals = frame_vals[source] = _values_for_columns(df, _pick_rows(df))  # NaN-safe via _f
+        yield {
+            "date_iso": di,
+            "dt": dt,
+            "vals": vals[pos],
+            "source": source,
+        }
+
+def _collect_candidates(bs_a: pd.DataFrame, bs_q: pd.DataFrame) -> List[dict]:
+    """Every candidate (annual + quarterly), newest → oldest; for debugging selections."""
+    return list(_iter_candidates(bs_a, bs_q))
 
 # ---------- Select newest viable within 2y that yields calculable ncav_ps ----------
 def _select_latest_viable_ncavps(
@@ -187,16 +349,14 @@ def _select_latest_viable_ncavps(
     if shares_out is None or shares_out <= 0:
         return None, {"assets_current": None, "liab_total": None}, None
 
-    cands = _collect_candidates(bs_a, bs_q)
-    if not cands:
-        return None, {"assets_current": None, "liab_total": None}, None
-
     cutoff = datetime.now(timezone.utc).date() - timedelta(days=max_age_days)
 
-    for c in cands:
+    for c in _iter_candidates(bs_a, bs_q):
         dt = c["dt"]
-        if dt is None or dt.date() < cutoff:
+        if dt is None:
             continue
+        if dt.date() < cutoff:
+            break  # newest first: everything after this is older still
         ca = c["vals"].get("assets_current")
         tl = c["vals"].get("liab_total")
         if ca is None or tl is None:
@@ -211,9 +371,10 @@ def _select_latest_viable_ncavps(
 
     return None, {"assets_current": None, "liab_total": None}, None
 
-def _financial_currency(t: yf.Ticker) -> str:
+def _financial_currency(t: yf.Ticker, info: Optional[dict] = None) -> str:
     try:
-        info = _retry(lambda: (t.info or {}))
+        if info is None:
+            info = _retry(lambda: (t.info or {}))
         return str(info.get("financialCurrency") or "USD").upper()
     except Exception:
         return "USD"
@@ -245,6 +406,7 @@ class NcavRecord:
 
         # 1) shares_out first (needed to validate NCAVps calculability)
         shares_out: Optional[float] = None
+        info: Optional[dict] = None  # kept for the currency lookup below (one round-trip, one limiter slot)
         try:
             info = _retry(lambda: (t.info or {}))
             so = info.get("sharesOutstanding")
@@ -271,7 +433,7 @@ class NcavRecord:
         # 3) select newest viable column within 2y that yields calculable NCAVps
         sel_date, comp, src = _select_latest_viable_ncavps(bs_a, bs_q, shares_out, max_age_days=730)
 
-        cur = _financial_currency(t)
+        cur = _financial_currency(t, info)
         ca = comp.get("assets_current")
         tl = comp.get("liab_total")
         ncav = (ca - tl) if (ca is not None and tl is not None) else None
@@ -312,14 +474,24 @@ def _cache_path(h: str) -> Path:
     return CACHE / f"{h.replace('/', '_')}.json"
 
 def load_cached(h: str) -> Optional[NcavRecord]:
-    p = _cache_path(h)
-    if not p.exists(): return None
     try:
-        return NcavRecord(**json.loads(p.read_text(encoding="utf-8")))
+        raw = _cache_path(h).read_bytes()
+    except OSError:
+        return None
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        try:
+            data = json.loads(raw)  # e.g. Infinity written by older stdlib dumps
+        except Exception:
+            return None
+    try:
+        return NcavRecord(**data)
     except Exception:
         return None
 
 def _nan_to_none(obj):
+    if isinstance(obj, float): return None if math.isnan(obj) else obj
     if isinstance(obj, dict):  return {k:_nan_to_none(v) for k,v in obj.items()}
     if isinstance(obj, list):  return [_nan_to_none(v) for v in obj]
     try:
@@ -328,26 +500,69 @@ def _nan_to_none(obj):
     return obj
 
 def save_cache(rec: NcavRecord) -> None:
-    payload = _nan_to_none(asdict(rec))
-    _cache_path(rec.ticker).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    p = _cache_path(rec.ticker)
+    payload = asdict(rec)
+    if orjson is not None:
+        try:
+            # orjson already writes NaN as null, so the record skips the _nan_to_none walk
+            p.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            return
+        except TypeError:
+            pass  # e.g. pd.NA / NaT; the stdlib path maps those to null
+    p.write_text(json.dumps(_nan_to_none(payload), ensure_ascii=False, indent=2), encoding="utf-8")
 
 # ---------- Public API (Windows-safe timeout) ----------
-def build_or_update(house_ticker: str, fetch_timeout: int = 15) -> NcavRecord:
+# One shared pool for the timeout wrapper. A per-call pool spawned a thread per
+# ticker, and its shutdown(wait=True) on exit blocked until the fetch finished,
+# so the timeout never actually returned early.
+# The pool also caps concurrent Yahoo fetches: callers running more threads than
+# NCAV_FETCH_WORKERS (e.g. a shortlist build with --max-workers 12) queue behind it.
+FETCH_WORKERS = int(os.environ.get("NCAV_FETCH_WORKERS", "8"))
+_FETCH_POOL = ThreadPoolExecutor(max_workers=max(1, FETCH_WORKERS), thread_name_prefix="ncav-fetch")
+
+# records fetched from Yahoo more recently than this are served without a request; 0 disables
+NCAV_TTL_HOURS = float(os.environ.get("NCAV_TTL_HOURS", "24"))
+
+def _fetched_within(rec: NcavRecord, hours: float) -> bool:
+    """True if rec came from a successful Yahoo fetch less than `hours` ago."""
+    if hours <= 0 or rec.note in ("timeout", "error"):
+        return False
+    try:
+        ts = datetime.fromisoformat(rec.cached_at)
+    except (TypeError, ValueError):
+        return False
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - ts < timedelta(hours=hours)
+
+def build_or_update(house_ticker: str, fetch_timeout: int = 15, min_refresh_hours: Optional[float] = None) -> NcavRecord:
     prev = load_cached(house_ticker)
-    def _do(): return NcavRecord.from_yahoo(house_ticker)
+    ttl = NCAV_TTL_HOURS if min_refresh_hours is None else min_refresh_hours
+    if prev and _fetched_within(prev, ttl):
+        return prev
+    started = threading.Event()
+    def _do():
+        started.set()
+        return NcavRecord.from_yahoo(house_ticker)
+    fut = _FETCH_POOL.submit(_do)
     try:
-        with ThreadPoolExecutor(max_workers=1) as ex:
-            cur = ex.submit(_do).result(timeout=fetch_timeout)
+        # fetch_timeout covers the fetch itself, not time queued behind other tickers'
+        # fetches; the queue wait gets its own fetch_timeout, since hung fetches keep
+        # their workers and a free one may never come
+        if not started.wait(fetch_timeout) and fut.cancel():
+            raise TimeoutError
+        cur = fut.result(timeout=fetch_timeout)
     except TimeoutError:
         if prev:
-            prev.cached_at = datetime.now(timezone.utc).isoformat(timespec="seconds"); save_cache(prev); return prev
+            # stale fallback: cached_at keeps the last successful fetch, so the next run retries
+            return prev
         cur = NcavRecord(house_ticker, to_yahoo(house_ticker), None, "", None, None, None, None, None,
                          "yahoo", datetime.now(timezone.utc).isoformat(timespec="seconds"), "", None, None, None, "timeout")
     except Exception:
         if prev:
-            prev.cached_at = datetime.now(timezone.utc).isoformat(timespec="seconds"); save_cache(prev); return prev
+            return prev
         cur = NcavRecord(house_ticker, to_yahoo(house_ticker), None, "", None, None, None, None, None,
-                         "yahoo", datetime.now(timezoneutc).isoformat(timespec="seconds"), "", None, None, None, "error")
+                         "yahoo", datetime.now(timezone.utc).isoformat(timespec="seconds"), "", None, None, None, "error")
     if prev and prev.statement_sig == cur.statement_sig:
         prev.cached_at = datetime.now(timezone.utc).isoformat(timespec="seconds"); save_cache(prev); return prev
     save_cache(cur); return cur
@@ -24,6 +24,18 @@ def main() -> None:
         default=str(default_shortlist),
         help="Path to ncav_shortlist.csv",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Concurrent core/insider cache reads",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Processes for per-ticker analysis (default: CPU count, 1 = in-process)",
+    )
     args = parser.parse_args()
 
     shortlist_path = Path(args.shortlist)
@@ -51,6 +63,8 @@ def main() -> None:
         insider_repo=insider_repo,
         fx_provider=fx_provider,
         writer=writer,
+        max_workers=args.workers,
+        analysis_processes=args.processes,
     )
 
     summary = service.screen_shortlist(shortlist_path)